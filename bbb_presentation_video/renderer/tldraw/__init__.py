@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Any, Dict, Generic, List, Optional, TypeVar, cast
 
 import cairo
@@ -96,6 +97,8 @@ from bbb_presentation_video.renderer.tldraw.shape.triangle import finalize_trian
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 class TldrawRenderer(Generic[CairoSomeSurface]):
     """Render tldraw whiteboard shapes"""
@@ -124,8 +127,10 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
     pattern: Optional[cairo.SurfacePattern] = None
     """Cached rendered whiteboard."""
 
-    shape_patterns: Dict[str, cairo.SurfacePattern]
-    """Cached rendered individual shapes for current presentation/slide."""
+    shape_recordings: Dict[str, cairo.RecordingSurface]
+    """Cached drawing commands for individual shapes of the current
+    presentation/slide, recorded in shape-local space so they can be replayed
+    under any transform."""
 
     bbb_version: Version
 
@@ -138,7 +143,7 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
         self.ctx = ctx
         self.presentation_slide = {}
         self.shapes = {}
-        self.shape_patterns = {}
+        self.shape_recordings = {}
         self.transform = transform
         self.bbb_version = bbb_version
 
@@ -163,7 +168,7 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
             return
 
         # Only keep cached shape patterns for the current presentation/slide
-        self.shape_patterns.clear()
+        self.shape_recordings.clear()
 
         self.presentation = presentation
         self.slide = self.presentation_slide.get(presentation, 0)
@@ -185,7 +190,7 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
             return
 
         # Only keep cached shape patterns for the current presentation/slide
-        self.shape_patterns.clear()
+        self.shape_recordings.clear()
 
         self.slide = slide
         self.presentation_slide[presentation] = slide
@@ -219,7 +224,7 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
                 return
 
         try:
-            del self.shape_patterns[id]
+            del self.shape_recordings[id]
         except KeyError:
             pass
 
@@ -241,7 +246,7 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
             return
 
         try:
-            del self.shape_patterns[id]
+            del self.shape_recordings[id]
         except KeyError:
             pass
 
@@ -267,33 +272,43 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
         shape: Shape,
         frame_map: Dict[str, List[Shape]],
     ) -> None:
-        if id in self.shape_patterns and not id in frame_map:
-            print(f"\tTldraw: Cached {shape.__class__.__name__}: {id}")
+        # Fully transparent shapes paint nothing; don't record or replay
+        # them. A later style update invalidates the recording cache, so a
+        # shape that becomes visible again is re-rendered normally.
+        if shape.style.opacity == 0:
+            return
+
+        if id in self.shape_recordings and not id in frame_map:
+            logger.debug("Tldraw: Cached %s: %s", shape.__class__.__name__, id)
         else:
-            ctx.push_group()
-            ctx.translate(*shape.point)
+            # Record the shape's drawing commands once in shape-local space.
+            # Replaying a RecordingSurface re-renders the vectors under the
+            # current transform, so the recording stays valid across zooms.
+            recording = cairo.RecordingSurface(cairo.Content.COLOR_ALPHA, None)
+            rec_ctx = cairo.Context(recording)
+            rec_ctx.translate(*shape.point)
             if isinstance(shape, ArrowGeoShape):
-                finalize_geo_arrow(ctx, id, shape)
+                finalize_geo_arrow(rec_ctx, id, shape)
             elif isinstance(shape, ArrowShape):
-                finalize_arrow(ctx, id, shape)
+                finalize_arrow(rec_ctx, id, shape)
             elif isinstance(shape, ArrowShapeV2):
-                finalize_arrow_v2(ctx, id, shape)
+                finalize_arrow_v2(rec_ctx, id, shape)
             elif isinstance(shape, CheckBoxGeoShape):
-                finalize_checkmark(ctx, id, shape)
+                finalize_checkmark(rec_ctx, id, shape)
             elif isinstance(shape, CloudGeoShape):
-                finalize_cloud(ctx, id, shape)
+                finalize_cloud(rec_ctx, id, shape)
             elif isinstance(shape, DiamondGeoShape):
-                finalize_diamond(ctx, id, shape)
+                finalize_diamond(rec_ctx, id, shape)
             elif isinstance(shape, DrawShape):
-                finalize_draw(ctx, id, shape)
+                finalize_draw(rec_ctx, id, shape)
             elif isinstance(shape, EllipseShape):
-                finalize_ellipse(ctx, id, shape)
+                finalize_ellipse(rec_ctx, id, shape)
             elif isinstance(shape, EllipseGeoShape):
-                finalize_geo_ellipse(ctx, id, shape)
+                finalize_geo_ellipse(rec_ctx, id, shape)
             elif isinstance(shape, FrameShape):
                 finalize_frame(
                     self,
-                    ctx,
+                    rec_ctx,
                     id,
                     shape,
                     frame_map,
@@ -303,43 +318,60 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
                 # individual shapes in the group.
                 pass
             elif isinstance(shape, HexagonGeoShape):
-                finalize_hexagon(ctx, id, shape)
+                finalize_hexagon(rec_ctx, id, shape)
             elif isinstance(shape, HighlighterShape):
-                finalize_highlight(ctx, id, shape)
+                finalize_highlight(rec_ctx, id, shape)
             elif isinstance(shape, LineShape):
-                finalize_line(ctx, id, shape)
+                finalize_line(rec_ctx, id, shape)
             elif isinstance(shape, OvalGeoShape):
-                finalize_oval(ctx, id, shape)
+                finalize_oval(rec_ctx, id, shape)
             elif isinstance(shape, RectangleShape):
-                finalize_rectangle(ctx, id, shape)
+                finalize_rectangle(rec_ctx, id, shape)
             elif isinstance(shape, RectangleGeoShape):
-                finalize_geo_rectangle(ctx, id, shape)
+                finalize_geo_rectangle(rec_ctx, id, shape)
             elif isinstance(shape, RhombusGeoShape):
-                finalize_rhombus(ctx, id, shape)
+                finalize_rhombus(rec_ctx, id, shape)
             elif isinstance(shape, StarGeoShape):
-                finalize_star(ctx, id, shape)
+                finalize_star(rec_ctx, id, shape)
             elif isinstance(shape, TrapezoidGeoShape):
-                finalize_trapezoid(ctx, id, shape)
+                finalize_trapezoid(rec_ctx, id, shape)
             elif isinstance(shape, TriangleShape):
-                finalize_triangle(ctx, id, shape)
+                finalize_triangle(rec_ctx, id, shape)
             elif isinstance(shape, TriangleGeoShape):
-                finalize_geo_triangle(ctx, id, shape)
+                finalize_geo_triangle(rec_ctx, id, shape)
             elif isinstance(shape, TextShape):
-                finalize_text(ctx, id, shape)
+                finalize_text(rec_ctx, id, shape)
             elif isinstance(shape, TextShapeV2):
-                finalize_v2_text(ctx, id, shape)
+                finalize_v2_text(rec_ctx, id, shape)
             elif isinstance(shape, StickyShape):
-                finalize_sticky(ctx, shape)
+                finalize_sticky(rec_ctx, shape)
             elif isinstance(shape, StickyShapeV2):
-                finalize_sticky_v2(ctx, shape)
+                finalize_sticky_v2(rec_ctx, shape)
             elif isinstance(shape, XBoxGeoShape):
-                finalize_x_box(ctx, id, shape)
+                finalize_x_box(rec_ctx, id, shape)
             else:
                 print(f"\tTldraw: Don't know how to render {shape}")
 
-            self.shape_patterns[id] = ctx.pop_group()
+            self.shape_recordings[id] = recording
+
+        # Replaying a recording is the per-frame cost, so reject shapes whose
+        # drawn extents fall outside the current clip before painting. The
+        # recording's ink extents are in the same user space the paint uses,
+        # which makes this a four-comparison bounding-box test.
+        recording = self.shape_recordings[id]
+        x, y, w, h = recording.ink_extents()
+        clip_x1, clip_y1, clip_x2, clip_y2 = ctx.clip_extents()
+        if (
+            w == 0
+            or h == 0
+            or x > clip_x2
+            or y > clip_y2
+            or x + w < clip_x1
+            or y + h < clip_y1
+        ):
+            return
 
-        ctx.set_source(self.shape_patterns[id])
+        ctx.set_source_surface(recording, 0, 0)
         ctx.paint()
 
     def finalize_frame(self, transform: Transform) -> bool:
@@ -358,9 +390,8 @@ class TldrawRenderer(Generic[CairoSomeSurface]):
             self.pattern = None
             return False
 
-        if transform_changed:
-            self.shape_patterns.clear()
-
+        # Shape recordings are replayed under the current transform, so they
+        # stay valid when the transform changes; no invalidation is needed.
         shapes = self.shapes[presentation][slide]
         print(f"\tTldraw: Rendering {len(shapes)} shapes.")
 
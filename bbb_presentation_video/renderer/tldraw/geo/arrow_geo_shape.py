@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from math import floor
 from random import Random
 from typing import List, Tuple, TypeVar
@@ -204,6 +205,8 @@ def arrow_geo_stroke_points(
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_geo_arrow(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: ArrowGeoShape
@@ -297,7 +300,7 @@ def dash_geo_arrow(ctx: cairo.Context[CairoSomeSurface], shape: ArrowGeoShape) -
 def finalize_geo_arrow(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: ArrowGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Arrow (geo): {id}")
+    logger.debug("Tldraw: Finalizing Arrow (geo): %s", id)
 
     ctx.rotate(shape.rotation)
 
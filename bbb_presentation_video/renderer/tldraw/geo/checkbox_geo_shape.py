@@ -4,13 +4,14 @@
 
 from __future__ import annotations
 
-from typing import List, TypeVar
+import logging
+from typing import List, Tuple, TypeVar
 
 import cairo
-import perfect_freehand
 
 from bbb_presentation_video.events.helpers import Position
 from bbb_presentation_video.renderer.tldraw.geo.rectangle_geo_shape import (
+    rectangle_outline_points,
     rectangle_stroke_points,
 )
 from bbb_presentation_video.renderer.tldraw.shape import CheckBoxGeoShape
@@ -27,8 +28,11 @@ from bbb_presentation_video.renderer.tldraw.utils import (
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
 
-def get_check_box_lines(w: float, h: float) -> List[List[List[float]]]:
+
+def get_check_box_lines(w: float, h: float) -> List[Tuple[float, float]]:
+    """The three vertices of the checkmark polyline, clamped to the box."""
     size = min(w, h) * 0.82
     ox = (w - size) / 2
     oy = (h - size) / 2
@@ -40,14 +44,9 @@ def get_check_box_lines(w: float, h: float) -> List[List[List[float]]]:
         return max(0, min(h, y))
 
     return [
-        [
-            [clamp_x(ox + size * 0.25), clamp_y(oy + size * 0.52)],
-            [clamp_x(ox + size * 0.45), clamp_y(oy + size * 0.82)],
-        ],
-        [
-            [clamp_x(ox + size * 0.45), clamp_y(oy + size * 0.82)],
-            [clamp_x(ox + size * 0.82), clamp_y(oy + size * 0.22)],
-        ],
+        (clamp_x(ox + size * 0.25), clamp_y(oy + size * 0.52)),
+        (clamp_x(ox + size * 0.45), clamp_y(oy + size * 0.82)),
+        (clamp_x(ox + size * 0.82), clamp_y(oy + size * 0.22)),
     ]
 
 
@@ -60,8 +59,8 @@ def overlay_checkmark(
     w = max(0, shape.size.width)
     h = max(0, shape.size.height)
 
-    # Get checkmark lines based on the dimensions
-    lines = get_check_box_lines(w, h)
+    # Get the checkmark polyline based on the dimensions
+    p0, p1, p2 = get_check_box_lines(w, h)
 
     stroke = STROKES[shape.style.color]
 
@@ -74,10 +73,11 @@ def overlay_checkmark(
     ctx.set_line_cap(cairo.LineCap.ROUND)
     ctx.set_line_join(cairo.LineJoin.ROUND)
 
-    # Draw each line of the checkmark
-    for start, end in lines:
-        for point in [start, end]:
-            ctx.line_to(*point)
+    # Draw the checkmark as a single polyline; the two strokes share the
+    # bottom vertex.
+    ctx.move_to(*p0)
+    ctx.line_to(*p1)
+    ctx.line_to(*p2)
     ctx.stroke()
 
 
@@ -94,14 +94,7 @@ def draw_checkbox(
         draw_smooth_stroke_point_path(ctx, stroke_points, closed=False)
         apply_geo_fill(ctx, style)
 
-    stroke_outline_points = perfect_freehand.get_stroke_outline_points(
-        stroke_points,
-        size=stroke_width,
-        thinning=0.65,
-        smoothing=1,
-        simulate_pressure=False,
-        last=True,
-    )
+    stroke_outline_points = rectangle_outline_points(id, shape)
 
     draw_smooth_path(ctx, stroke_outline_points, closed=True)
 
@@ -137,7 +130,7 @@ def dash_checkbox(
 def finalize_checkmark(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: CheckBoxGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing checkmark: {id}")
+    logger.debug("Tldraw: Finalizing checkmark: %s", id)
 
     ctx.rotate(shape.rotation)
 
@@ -6,13 +6,14 @@
 
 from __future__ import annotations
 
+import logging
 import math
 from math import atan2, tau
 from random import Random
-from typing import Any, Callable, List, Optional, TypedDict, TypeVar, Union
+from typing import List, TypeVar
 
-import attr
 import cairo
+import numpy as np
 
 from bbb_presentation_video.events.helpers import Position
 from bbb_presentation_video.renderer.tldraw import vec
@@ -24,38 +25,13 @@ from bbb_presentation_video.renderer.tldraw.utils import (
     DashStyle,
     SizeStyle,
     apply_geo_fill,
-    circle_from_three_points,
     get_perfect_dash_props,
-    get_point_on_circle,
+    rng_from_id,
 )
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
-
-@attr.s(auto_attribs=True, slots=True)
-class StraightPillSection:
-    start: Position
-    delta: Position
-    type: str = "straight"
-    center: Position = Position(-1, -1)
-    start_angle: float = 0
-
-
-@attr.s(auto_attribs=True, slots=True)
-class ArcPillSection:
-    start_angle: float
-    center: Position
-    type: str = "arc"
-    start: Position = Position(-1, -1)
-    delta: Position = Position(-1, -1)
-
-
-class Arc(TypedDict):
-    leftPoint: Position
-    rightPoint: Position
-    arcPoint: Position
-    center: Optional[Position]
-    radius: float
+logger = logging.getLogger(__name__)
 
 
 def get_pill_circumference(w: float, h: float) -> float:
@@ -64,66 +40,51 @@ def get_pill_circumference(w: float, h: float) -> float:
     return tau * radius + 2 * long_side
 
 
-def get_pill_points(width: float, height: float, numPoints: int) -> List[Position]:
+def get_pill_points(width: float, height: float, numPoints: int) -> np.ndarray:
     radius = min(width, height) / 2
     long_side = max(width, height) - radius * 2
     circumference = tau * radius + 2 * long_side
     spacing = circumference / numPoints
+    arc_length = tau / 2 * radius
 
-    sections: List[Union[StraightPillSection, ArcPillSection]] = []
-
+    # The pill perimeter alternates straight side, end cap arc, straight side,
+    # end cap arc. Describe the four sections as parallel arrays so every
+    # sampled point can be computed in one vectorized pass below.
     if width > height:
         # Definitions for a horizontally oriented pill
-        sections = [
-            StraightPillSection(start=Position(radius, 0), delta=Position(1, 0)),
-            ArcPillSection(
-                center=Position(width - radius, radius), start_angle=-tau / 4
-            ),
-            StraightPillSection(
-                start=Position(width - radius, height), delta=Position(-1, 0)
-            ),
-            ArcPillSection(center=Position(radius, radius), start_angle=tau / 4),
-        ]
+        starts = np.array([(radius, 0), (0, 0), (width - radius, height), (0, 0)])
+        deltas = np.array([(1, 0), (0, 0), (-1, 0), (0, 0)])
+        centers = np.array([(0, 0), (width - radius, radius), (0, 0), (radius, radius)])
+        start_angles = np.array([0, -tau / 4, 0, tau / 4])
     else:
         # Definitions for a vertically oriented pill
-        sections = [
-            StraightPillSection(start=Position(width, radius), delta=Position(0, 1)),
-            ArcPillSection(center=Position(radius, height - radius), start_angle=0),
-            StraightPillSection(
-                start=Position(0, height - radius), delta=Position(0, -1)
-            ),
-            ArcPillSection(center=Position(radius, radius), start_angle=tau / 2),
-        ]
-
-    points: List[Position] = []
-    section_offset = 0.0
-
-    for _ in range(numPoints):
-        section = sections[0]
-
-        if section.type == "straight":
-            straight_point = vec.add(
-                section.start, vec.mul(section.delta, section_offset)
-            )
-            points.append(Position(straight_point[0], straight_point[1]))
-        else:
-            point = get_point_on_circle(
-                section.center, radius, section.start_angle + section_offset / radius
-            )
-            points.append(point)
-
-        section_offset += spacing
-        section_length = long_side if section.type == "straight" else tau / 2 * radius
+        starts = np.array([(width, radius), (0, 0), (0, height - radius), (0, 0)])
+        deltas = np.array([(0, 1), (0, 0), (0, -1), (0, 0)])
+        centers = np.array(
+            [(0, 0), (radius, height - radius), (0, 0), (radius, radius)]
+        )
+        start_angles = np.array([0, 0, 0, tau / 2])
+
+    # Cumulative arclength of each sample, classified into a section by the
+    # section end boundaries. A sample exactly on a boundary belongs to the
+    # earlier section, matching ``side="left"``.
+    lengths = np.array([long_side, arc_length, long_side, arc_length])
+    bounds = np.cumsum(lengths)
+    s = np.arange(numPoints, dtype=np.float64) * spacing
+    section = np.minimum(np.searchsorted(bounds, s, side="left"), 3)
+    local = s - (bounds[section] - lengths[section])
+
+    straight_points = starts[section] + deltas[section] * local[:, None]
+    angles = start_angles[section] + local / radius
+    arc_points = centers[section] + radius * np.stack(
+        (np.cos(angles), np.sin(angles)), axis=1
+    )
 
-        while section_offset > section_length:
-            section_offset -= section_length
-            sections.append(sections.pop(0))
-            section = sections[0]
-            section_length = (
-                long_side if section.type == "straight" else tau / 2 * radius
-            )
+    is_arc = (section % 2) == 1
 
-    return points
+    # Stay in array form; the cloud code consumes these as ndarray rows and
+    # only constructs Position objects at the cairo boundary.
+    return np.where(is_arc[:, None], arc_points, straight_points)
 
 
 def switchSize(size: SizeStyle) -> float:
@@ -139,10 +100,67 @@ def switchSize(size: SizeStyle) -> float:
         return 70.0
 
 
+def _cloud_arcs_kernel(
+    bumpPoints: np.ndarray,
+    width: float,
+    height: float,
+    paddingX: float,
+    paddingY: float,
+    distanceBetweenPointsOnPerimeter: float,
+) -> np.ndarray:
+    """Compute the arc geometry for all bumps in one fused pass.
+
+    Takes the wiggled bump points as an ``(n, 2)`` float array plus the scalar
+    shape parameters, and returns an ``(n, 9)`` array with columns
+    ``lx, ly, rx, ry, cx, cy, radius, start_angle, end_angle``. Keeping this
+    free of Python object types lets the whole per-bump math run as array
+    operations.
+    """
+    leftPoints = bumpPoints
+    rightPoints = np.roll(bumpPoints, -1, axis=0)
+    midPoints = (leftPoints + rightPoints) / 2
+    deltas = rightPoints - leftPoints
+    offsetAngles = np.arctan2(deltas[:, 1], deltas[:, 0]) - tau / 4
+
+    distancesBetweenPoints = np.hypot(deltas[:, 0], deltas[:, 1])
+    curvatureOffsets = distanceBetweenPointsOnPerimeter - distancesBetweenPoints
+    # The wiggle points are the bump points themselves, so the relative size
+    # factor between the wiggled and original distances is always 1.
+    finalDistances = max(paddingX, paddingY) + curvatureOffsets
+
+    arcPoints = midPoints + finalDistances[:, None] * np.stack(
+        (np.cos(offsetAngles), np.sin(offsetAngles)), axis=1
+    )
+    np.clip(arcPoints, 0, (width, height), out=arcPoints)
+
+    # Circumscribed circle through (left, right, arc) for every bump at once,
+    # using the closed-form determinant expression. Degenerate (collinear)
+    # triples produce NaN centers, which the drawing code renders as a
+    # straight line between the two points.
+    a, b, c = leftPoints, rightPoints, arcPoints
+    d = 2 * (
+        (a[:, 0] - c[:, 0]) * (b[:, 1] - c[:, 1])
+        - (b[:, 0] - c[:, 0]) * (a[:, 1] - c[:, 1])
+    )
+    d = np.where(d == 0, np.nan, d)
+    a2 = np.einsum("ij,ij->i", a, a)
+    b2 = np.einsum("ij,ij->i", b, b)
+    c2 = np.einsum("ij,ij->i", c, c)
+    ux = ((a2 - c2) * (b[:, 1] - c[:, 1]) - (b2 - c2) * (a[:, 1] - c[:, 1])) / d
+    uy = ((b2 - c2) * (a[:, 0] - c[:, 0]) - (a2 - c2) * (b[:, 0] - c[:, 0])) / d
+    radii = np.hypot(ux - a[:, 0], uy - a[:, 1])
+    startAngles = np.arctan2(a[:, 1] - uy, a[:, 0] - ux)
+    endAngles = np.arctan2(b[:, 1] - uy, b[:, 0] - ux)
+
+    return np.column_stack(
+        (leftPoints, rightPoints, ux, uy, radii, startAngles, endAngles)
+    )
+
+
 def get_cloud_arcs(
     width: float, height: float, seed: str, size: SizeStyle
-) -> List[Arc]:
-    random = Random(seed)
+) -> np.ndarray:
+    rng = rng_from_id(seed)
     pillCircumference = get_pill_circumference(width, height)
 
     numBumps = max(
@@ -161,73 +179,31 @@ def get_cloud_arcs(
         get_pill_circumference(innerWidth, innerHeight) / numBumps
     )
 
-    bumpPoints = [
-        vec.add(p, (paddingX, paddingY))
-        for p in get_pill_points(innerWidth, innerHeight, numBumps)
-    ]
+    bumpPoints = get_pill_points(innerWidth, innerHeight, numBumps) + (
+        paddingX,
+        paddingY,
+    )
     maxWiggleX = 0 if width < 20 else targetBumpProtrusion * 0.3
     maxWiggleY = 0 if height < 20 else targetBumpProtrusion * 0.3
 
-    for i in range(math.floor(numBumps / 2)):
-        bumpPoints[i] = vec.add(
-            bumpPoints[i], (random.random() * maxWiggleX, random.random() * maxWiggleY)
-        )
-        bumpPoints[numBumps - i - 1] = vec.add(
-            bumpPoints[numBumps - i - 1],
-            (random.random() * maxWiggleX, random.random() * maxWiggleY),
-        )
-
-    arcs = []
-
-    for i in range(len(bumpPoints)):
-        j = 0 if i == len(bumpPoints) - 1 else i + 1
-        leftWigglePoint = bumpPoints[i]
-        rightWigglePoint = bumpPoints[j]
-        leftPoint = bumpPoints[i]
-        rightPoint = bumpPoints[j]
-
-        midPoint = vec.med(leftPoint, rightPoint)
-        offsetAngle = vec.angle(leftPoint, rightPoint) - tau / 4
-
-        distanceBetweenOriginalPoints = vec.dist(leftPoint, rightPoint)
-        curvatureOffset = (
-            distanceBetweenPointsOnPerimeter - distanceBetweenOriginalPoints
+    # Wiggle the first and last halves of the bump points in one shot; the
+    # draws stay deterministic per shape id via the seeded generator.
+    half = numBumps // 2
+    if half > 0:
+        wiggle = rng.random((half, 4)) * (
+            maxWiggleX,
+            maxWiggleY,
+            maxWiggleX,
+            maxWiggleY,
         )
-        distanceBetweenWigglePoints = vec.dist(leftWigglePoint, rightWigglePoint)
-        relativeSize = distanceBetweenWigglePoints / distanceBetweenOriginalPoints
-        finalDistance = (max(paddingX, paddingY) + curvatureOffset) * relativeSize
+        bumpPoints[:half] += wiggle[:, :2]
+        bumpPoints[numBumps - half :] += wiggle[::-1, 2:]
 
-        arcPoint = vec.add(midPoint, vec.from_angle(offsetAngle, finalDistance))
-
-        arcPoint_x = (
-            0 if arcPoint[0] < 0 else (width if arcPoint[0] > width else arcPoint[0])
-        )
-        arcPoint_y = (
-            0 if arcPoint[1] < 0 else (height if arcPoint[1] > height else arcPoint[1])
-        )
-        arcPoint = (arcPoint_x, arcPoint_y)
-
-        center_pos, _ = circle_from_three_points(
-            leftWigglePoint, rightWigglePoint, arcPoint
-        )
-        center = (center_pos[0], center_pos[1])
-
-        radius = vec.dist(
-            center if center_pos else vec.med(leftWigglePoint, rightWigglePoint),
-            leftWigglePoint,
-        )
-
-        arc_dict = Arc(
-            leftPoint=Position(*leftWigglePoint),
-            rightPoint=Position(*rightWigglePoint),
-            arcPoint=Position(*arcPoint),
-            center=Position(*center) if center is not None else None,
-            radius=radius,
-        )
-
-        arcs.append(arc_dict)
-
-    return arcs
+    # Rows of lx, ly, rx, ry, cx, cy, radius, start_angle, end_angle; a NaN
+    # center marks a degenerate arc to be drawn as a straight line.
+    return _cloud_arcs_kernel(
+        bumpPoints, width, height, paddingX, paddingY, distanceBetweenPointsOnPerimeter
+    )
 
 
 def clockwise_angle_dist(a0: float, a1: float) -> float:
@@ -257,26 +233,24 @@ def points_on_arc(
 
     l = clockwise_angle_dist(start_angle, end_angle)
 
-    for i in range(num_points):
-        t = i / (num_points - 1)
-        angle = start_angle + l * t
-        point = get_point_on_circle(center, radius, angle)
-        results.append(point)
+    # Step around the arc with the angle-addition recurrence
+    # (c, s) <- (c*cos(da) - s*sin(da), s*cos(da) + c*sin(da))
+    # so only the step angle needs a cos/sin evaluation.
+    step = l / (num_points - 1)
+    cos_step = math.cos(step)
+    sin_step = math.sin(step)
+    c = math.cos(start_angle)
+    s = math.sin(start_angle)
+    cx = center[0]
+    cy = center[1]
+
+    for _ in range(num_points):
+        results.append(Position(cx + radius * c, cy + radius * s))
+        c, s = c * cos_step - s * sin_step, s * cos_step + c * sin_step
 
     return results
 
 
-def mutate_point(p: Position, mut_func: Callable[[Any], Any]) -> Position:
-    return Position(mut_func(p[0]), mut_func(p[1]))
-
-
-def calculate_angle(center: Position, point: Position) -> float:
-    dx = point[0] - center[0]
-    dy = point[1] - center[1]
-    angle = atan2(dy, dx)
-    return angle
-
-
 def dash_cloud(
     ctx: cairo.Context[CairoSomeSurface], shape: CloudGeoShape, id: str
 ) -> None:
@@ -290,30 +264,17 @@ def dash_cloud(
 
     stroke = STROKES[style.color]
 
-    ctx.save()
-
-    arcs: List[Arc] = get_cloud_arcs(w, h, id, style.size)
+    arcs = get_cloud_arcs(w, h, id, style.size)
 
     ctx.new_sub_path()
 
-    for arc in arcs:
-        leftPoint, rightPoint, radius, center = (
-            arc["leftPoint"],
-            arc["rightPoint"],
-            arc["radius"],
-            arc["center"],
-        )
-
-        if center is None:
-            # Move to leftPoint and draw a line to rightPoint instead of an arc
-            ctx.move_to(*leftPoint)
-            ctx.line_to(*rightPoint)
+    for lx, ly, rx, ry, cx, cy, radius, start_angle, end_angle in arcs:
+        if math.isnan(cx):
+            # Draw a line instead of an arc for degenerate (collinear) bumps
+            ctx.move_to(lx, ly)
+            ctx.line_to(rx, ry)
         else:
-            # Calculate start and end angles
-            start_angle = calculate_angle(center, leftPoint)
-            end_angle = calculate_angle(center, rightPoint)
-
-            ctx.arc(center[0], center[1], radius, start_angle, end_angle)
+            ctx.arc(cx, cy, radius, start_angle, end_angle)
 
     ctx.close_path()
 
@@ -333,7 +294,9 @@ def dash_cloud(
     ctx.set_source_rgba(stroke.r, stroke.g, stroke.b, style.opacity)
 
     ctx.stroke()
-    ctx.restore()
+    # The save/restore pair that used to scope the dash pattern was a full
+    # graphics-state clone; clearing the dash directly is much cheaper.
+    ctx.set_dash([], 0)
 
 
 def draw_cloud(
@@ -355,46 +318,36 @@ def draw_cloud(
         SizeStyle.XL: 1.6,
     }
     mut_multiplier = size_multipliers.get(shape.style.size, 1.0)
-    mut = lambda n: n + random.random() * mut_multiplier * 2
+
+    def mut(n: float) -> float:
+        return n + random.random() * mut_multiplier * 2
 
     width = max(0, shape.size.width)
     height = max(0, shape.size.height)
     arcs = get_cloud_arcs(width, height, id, shape.style.size)
-    avg_arc_length = sum(
-        math.sqrt(
-            (arc["leftPoint"][0] - arc["rightPoint"][0]) ** 2
-            + (arc["leftPoint"][1] - arc["rightPoint"][1]) ** 2
-        )
-        for arc in arcs
-    ) / len(arcs)
+    avg_arc_length = np.hypot(arcs[:, 0] - arcs[:, 2], arcs[:, 1] - arcs[:, 3]).mean()
     should_mutate_points = avg_arc_length > mut_multiplier * 15
 
     ctx.new_sub_path()
 
-    for arc in arcs:
-        leftPoint, rightPoint, radius, center = (
-            arc["leftPoint"],
-            arc["rightPoint"],
-            arc["radius"],
-            arc["center"],
-        )
-
+    for lx, ly, rx, ry, cx, cy, radius, start_angle, end_angle in arcs:
         if should_mutate_points:
-            leftPoint = mutate_point(leftPoint, mut)
-            rightPoint = mutate_point(rightPoint, mut)
+            lx, ly = mut(lx), mut(ly)
+            rx, ry = mut(rx), mut(ry)
 
-        if center is None:
-            ctx.move_to(*leftPoint)
-            ctx.line_to(*rightPoint)
+        if math.isnan(cx):
+            ctx.move_to(lx, ly)
+            ctx.line_to(rx, ry)
         else:
-            start_angle = calculate_angle(center, leftPoint)
-            end_angle = calculate_angle(center, rightPoint)
-
             if should_mutate_points:
-                center = mutate_point(center, mut)
+                # Angles come from the mutated end points but the original
+                # center, matching how the point-based code drew before.
+                start_angle = atan2(ly - cy, lx - cx)
+                end_angle = atan2(ry - cy, rx - cx)
+                cx, cy = mut(cx), mut(cy)
                 radius += random.random() * mut_multiplier
 
-            ctx.arc(center[0], center[1], radius, start_angle, end_angle)
+            ctx.arc(cx, cy, radius, start_angle, end_angle)
 
     ctx.close_path()
 
@@ -419,7 +372,7 @@ def draw_cloud(
 def finalize_cloud(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: CloudGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Cloud: {id}")
+    logger.debug("Tldraw: Finalizing Cloud: %s", id)
 
     ctx.rotate(shape.rotation)
 
@@ -4,8 +4,10 @@
 
 from __future__ import annotations
 
-from random import Random
-from typing import List, TypeVar
+import logging
+from functools import lru_cache
+from math import hypot
+from typing import List, Tuple, TypeVar
 
 import cairo
 import perfect_freehand
@@ -23,49 +25,37 @@ from bbb_presentation_video.renderer.tldraw.utils import (
     draw_smooth_path,
     draw_smooth_stroke_point_path,
     finalize_geo_path,
+    rng_from_id,
 )
 
 
-def diamond_stroke_points(id: str, shape: DiamondGeoShape) -> List[StrokePoint]:
-    random = Random(id)
-    size = shape.size
-
-    width = size.width
-    height = size.height
-    half_width = size.width / 2
-    half_height = size.height / 2
+# The stroke geometry is a pure function of the shape id (which seeds the
+# PRNG) and its dimensions, so it can be memoized across frames.
+@lru_cache(maxsize=512)
+def _diamond_stroke_points(
+    id: str, width: float, height: float, stroke_width: float
+) -> List[StrokePoint]:
+    rng = rng_from_id(id)
 
-    stroke_width = STROKE_WIDTHS[shape.style.size]
+    half_width = width / 2
+    half_height = height / 2
 
-    # Corners with random offsets
+    # Corner jitter, drawn in one vectorized call
     variation = stroke_width * 0.75
-
-    t = (
-        half_width + random.uniform(-variation, variation),
-        random.uniform(-variation, variation),
-    )
-    r = (
-        width + random.uniform(-variation, variation),
-        half_height + random.uniform(-variation, variation),
-    )
-    b = (
-        half_width + random.uniform(-variation, variation),
-        height + random.uniform(-variation, variation),
-    )
-    l = (
-        random.uniform(-variation, variation),
-        half_height + random.uniform(-variation, variation),
-    )
+    offsets = rng.uniform(-variation, variation, size=(4, 2))
 
     # Which side to start drawing first
-    rm = random.randrange(0, 3)
-
-    lines = [
-        vec.points_between(t, r, 32),
-        vec.points_between(r, b, 32),
-        vec.points_between(b, l, 32),
-        vec.points_between(l, t, 32),
-    ]
+    rm = int(rng.integers(0, 3))
+
+    # The un-jittered corners are shared (and cached) across all diamonds of
+    # this size; only the per-id jitter varies.
+    corners = (
+        (half_width, 0.0),
+        (width, half_height),
+        (half_width, height),
+        (0.0, half_height),
+    )
+    lines = vec.points_between_batch(corners, 32, offsets=offsets)
 
     lines = lines[rm:] + lines[0:rm]
     points = [*lines[0], *lines[1], *lines[2], *lines[3], *lines[0]]
@@ -75,8 +65,30 @@ def diamond_stroke_points(id: str, shape: DiamondGeoShape) -> List[StrokePoint]:
     )
 
 
+@lru_cache(maxsize=512)
+def _diamond_outline_points(
+    id: str, width: float, height: float, stroke_width: float
+) -> List[Tuple[float, float]]:
+    return perfect_freehand.get_stroke_outline_points(
+        _diamond_stroke_points(id, width, height, stroke_width),
+        size=stroke_width,
+        thinning=0.65,
+        smoothing=1,
+        simulate_pressure=False,
+        last=True,
+    )
+
+
+def diamond_stroke_points(id: str, shape: DiamondGeoShape) -> List[StrokePoint]:
+    return _diamond_stroke_points(
+        id, shape.size.width, shape.size.height, STROKE_WIDTHS[shape.style.size]
+    )
+
+
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_diamond(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: DiamondGeoShape
@@ -92,13 +104,8 @@ def draw_diamond(
         draw_smooth_stroke_point_path(ctx, stroke_points, closed=False)
         apply_geo_fill(ctx, style)
 
-    stroke_outline_points = perfect_freehand.get_stroke_outline_points(
-        stroke_points,
-        size=stroke_width,
-        thinning=0.65,
-        smoothing=1,
-        simulate_pressure=False,
-        last=True,
+    stroke_outline_points = _diamond_outline_points(
+        id, shape.size.width, shape.size.height, stroke_width
     )
     draw_smooth_path(ctx, stroke_outline_points, closed=True)
 
@@ -126,13 +133,14 @@ def dash_diamond(ctx: cairo.Context[CairoSomeSurface], shape: DiamondGeoShape) -
         Position(0, half_height),
     ]
 
-    finalize_geo_path(ctx, points, style)
+    # All four sides are the same length, so the perimeter is known up front.
+    finalize_geo_path(ctx, points, style, perimeter=4 * hypot(half_width, half_height))
 
 
 def finalize_diamond(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: DiamondGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Diamond: {id}")
+    logger.debug("Tldraw: Finalizing Diamond: %s", id)
 
     style = shape.style
 
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TypeVar
 
 import cairo
@@ -21,6 +22,8 @@ from bbb_presentation_video.renderer.utils import cairo_draw_ellipse
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def dash_ellipse(ctx: cairo.Context[CairoSomeSurface], shape: EllipseGeoShape) -> None:
     radius = (shape.size.width / 2, shape.size.height / 2)
@@ -58,7 +61,7 @@ def finalize_geo_ellipse(
     id: str,
     shape: EllipseGeoShape,
 ) -> None:
-    print(f"\tTldraw: Finalizing Ellipse (geo): {id}")
+    logger.debug("Tldraw: Finalizing Ellipse (geo): %s", id)
 
     ctx.rotate(shape.rotation)
 
@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
-from typing import List, TypeVar
+import logging
+from functools import lru_cache
+from typing import List, Tuple, TypeVar
 
 import cairo
 import perfect_freehand
@@ -25,29 +27,48 @@ from bbb_presentation_video.renderer.tldraw.utils import (
 )
 
 
-def hexagon_stroke_points(id: str, shape: HexagonGeoShape) -> List[StrokePoint]:
-    size = shape.size
-
-    width = size.width
-    height = size.height
-
-    stroke_width = STROKE_WIDTHS[shape.style.size]
-
-    width = max(0, shape.size.width)
-    height = max(0, shape.size.height)
-
+# The stroke geometry is a pure function of the shape id (which seeds the
+# PRNG) and its dimensions, so it can be memoized across frames.
+@lru_cache(maxsize=512)
+def _hexagon_stroke_points(
+    id: str, width: float, height: float, stroke_width: float
+) -> List[StrokePoint]:
     sides = 6
 
     strokes = get_polygon_strokes(width, height, sides)
-    points = get_polygon_draw_vertices(strokes, stroke_width, id)
+    vertices = tuple((stroke[0].x, stroke[0].y) for stroke in strokes)
+    points = get_polygon_draw_vertices(vertices, stroke_width, id)
 
     return perfect_freehand.get_stroke_points(
         points, size=stroke_width, streamline=0.3, last=True
     )
 
 
+@lru_cache(maxsize=512)
+def _hexagon_outline_points(
+    id: str, width: float, height: float, stroke_width: float
+) -> List[Tuple[float, float]]:
+    return perfect_freehand.get_stroke_outline_points(
+        _hexagon_stroke_points(id, width, height, stroke_width),
+        size=stroke_width,
+        thinning=0.65,
+        smoothing=1,
+        simulate_pressure=False,
+        last=True,
+    )
+
+
+def hexagon_stroke_points(id: str, shape: HexagonGeoShape) -> List[StrokePoint]:
+    width = max(0, shape.size.width)
+    height = max(0, shape.size.height)
+
+    return _hexagon_stroke_points(id, width, height, STROKE_WIDTHS[shape.style.size])
+
+
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_hexagon(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: HexagonGeoShape
@@ -63,13 +84,8 @@ def draw_hexagon(
         draw_smooth_stroke_point_path(ctx, stroke_points, closed=False)
         apply_geo_fill(ctx, style)
 
-    stroke_outline_points = perfect_freehand.get_stroke_outline_points(
-        stroke_points,
-        size=stroke_width,
-        thinning=0.65,
-        smoothing=1,
-        simulate_pressure=False,
-        last=True,
+    stroke_outline_points = _hexagon_outline_points(
+        id, max(0, shape.size.width), max(0, shape.size.height), stroke_width
     )
     draw_smooth_path(ctx, stroke_outline_points, closed=True)
 
@@ -97,7 +113,7 @@ def dash_hexagon(ctx: cairo.Context[CairoSomeSurface], shape: HexagonGeoShape) -
 def finalize_hexagon(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: HexagonGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Hexagon: {id}")
+    logger.debug("Tldraw: Finalizing Hexagon: %s", id)
 
     style = shape.style
 
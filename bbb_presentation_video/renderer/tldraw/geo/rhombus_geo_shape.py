@@ -4,8 +4,9 @@
 
 from __future__ import annotations
 
-from random import Random
-from typing import List, TypeVar
+import logging
+from functools import lru_cache
+from typing import List, Tuple, TypeVar
 
 import cairo
 import perfect_freehand
@@ -23,48 +24,36 @@ from bbb_presentation_video.renderer.tldraw.utils import (
     draw_smooth_path,
     draw_smooth_stroke_point_path,
     finalize_geo_path,
+    rng_from_id,
 )
 
 
-def rhombus_stroke_points(id: str, shape: RhombusGeoShape) -> List[StrokePoint]:
-    random = Random(id)
-    size = shape.size
-
-    width = size.width
-    height = size.height
+# The stroke geometry is a pure function of the shape id (which seeds the
+# PRNG) and its dimensions, so it can be memoized across frames.
+@lru_cache(maxsize=512)
+def _rhombus_stroke_points(
+    id: str, width: float, height: float, stroke_width: float
+) -> List[StrokePoint]:
+    rng = rng_from_id(id)
 
     x_offset = min(width * 0.38, height * 0.38)
-    stroke_width = STROKE_WIDTHS[shape.style.size]
 
-    # Corners with random offsets
+    # Corner jitter, drawn in one vectorized call
     variation = stroke_width * 0.75
-
-    tl = (
-        x_offset + random.uniform(-variation, variation),
-        random.uniform(-variation, variation),
-    )
-    tr = (
-        width + random.uniform(-variation, variation),
-        0 + random.uniform(-variation, variation),
-    )
-    br = (
-        width - x_offset + random.uniform(-variation, variation),
-        height + random.uniform(-variation, variation),
-    )
-    bl = (
-        random.uniform(-variation, variation),
-        height + random.uniform(-variation, variation),
-    )
+    offsets = rng.uniform(-variation, variation, size=(4, 2))
 
     # Which side to start drawing first
-    rm = random.randrange(0, 3)
-
-    lines = [
-        vec.points_between(tl, tr, 32),
-        vec.points_between(tr, br, 32),
-        vec.points_between(br, bl, 32),
-        vec.points_between(bl, tl, 32),
-    ]
+    rm = int(rng.integers(0, 3))
+
+    # The un-jittered corners are shared (and cached) across all rhombi of
+    # this size; only the per-id jitter varies.
+    corners = (
+        (x_offset, 0.0),
+        (width, 0.0),
+        (width - x_offset, height),
+        (0.0, height),
+    )
+    lines = vec.points_between_batch(corners, 32, offsets=offsets)
     lines = lines[rm:] + lines[0:rm]
 
     points = [*lines[0], *lines[1], *lines[2], *lines[3], *lines[0]]
@@ -74,8 +63,30 @@ def rhombus_stroke_points(id: str, shape: RhombusGeoShape) -> List[StrokePoint]:
     )
 
 
+@lru_cache(maxsize=512)
+def _rhombus_outline_points(
+    id: str, width: float, height: float, stroke_width: float
+) -> List[Tuple[float, float]]:
+    return perfect_freehand.get_stroke_outline_points(
+        _rhombus_stroke_points(id, width, height, stroke_width),
+        size=stroke_width,
+        thinning=0.65,
+        smoothing=1,
+        simulate_pressure=False,
+        last=True,
+    )
+
+
+def rhombus_stroke_points(id: str, shape: RhombusGeoShape) -> List[StrokePoint]:
+    return _rhombus_stroke_points(
+        id, shape.size.width, shape.size.height, STROKE_WIDTHS[shape.style.size]
+    )
+
+
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_rhombus(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: RhombusGeoShape
@@ -91,13 +102,8 @@ def draw_rhombus(
         draw_smooth_stroke_point_path(ctx, stroke_points, closed=False)
         apply_geo_fill(ctx, style)
 
-    stroke_outline_points = perfect_freehand.get_stroke_outline_points(
-        stroke_points,
-        size=stroke_width,
-        thinning=0.65,
-        smoothing=1,
-        simulate_pressure=False,
-        last=True,
+    stroke_outline_points = _rhombus_outline_points(
+        id, shape.size.width, shape.size.height, stroke_width
     )
     draw_smooth_path(ctx, stroke_outline_points, closed=True)
 
@@ -129,7 +135,7 @@ def dash_rhombus(ctx: cairo.Context[CairoSomeSurface], shape: RhombusGeoShape) -
 def finalize_rhombus(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: RhombusGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Rhombus: {id}")
+    logger.debug("Tldraw: Finalizing Rhombus: %s", id)
 
     style = shape.style
 
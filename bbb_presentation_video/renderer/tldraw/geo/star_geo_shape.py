@@ -4,10 +4,13 @@
 
 from __future__ import annotations
 
-from math import cos, sin, tau
-from typing import List, TypeVar
+import logging
+from functools import lru_cache
+from math import tau
+from typing import List, Tuple, TypeVar
 
 import cairo
+import numpy as np
 import perfect_freehand
 from perfect_freehand.types import StrokePoint
 
@@ -15,8 +18,6 @@ from bbb_presentation_video.events.helpers import Position
 from bbb_presentation_video.renderer.tldraw.shape import StarGeoShape
 from bbb_presentation_video.renderer.tldraw.shape.text_v2 import finalize_v2_label
 from bbb_presentation_video.renderer.tldraw.utils import (
-    STROKE_WIDTHS,
-    STROKES,
     DashStyle,
     apply_geo_fill,
     draw_smooth_path,
@@ -26,66 +27,113 @@ from bbb_presentation_video.renderer.tldraw.utils import (
 )
 
 
-def get_star_points(w: float, h: float, n: int) -> List[Position]:
-    sides = n
-    step = tau / sides / 2
+@lru_cache(maxsize=8)
+def _star_unit_vertices(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The 2n alternating outer/inner star vertices for a unit bounding box,
+    centered on the origin.
 
-    # Calculate the bounding box adjustments
-    cx, cy = w / 2, h / 2
-    ratio = 1
-    ox, oy = (w / 2, h / 2)
-    ix, iy = (ox * ratio) / 2, (oy * ratio) / 2
+    The vertex angles and the outer/inner radius factors (1/2 and 1/4 of the
+    box) only depend on the vertex count, so they are folded into one table
+    and every star render is just a multiply-add per axis."""
+    step = tau / n / 2
+    i = np.arange(n * 2)
+    angles = -(tau / 4) + i * step
+    radii = np.where((i % 2) == 1, 0.25, 0.5)
+    return radii * np.cos(angles), radii * np.sin(angles)
 
-    points = [
-        Position(
-            cx + (ix if i % 2 else ox) * cos(-(tau / 4) + i * step),
-            cy + (iy if i % 2 else oy) * sin(-(tau / 4) + i * step),
-        )
-        for i in range(sides * 2)
-    ]
 
-    return points
+def _star_vertices(w: float, h: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The 2n alternating outer/inner star vertices as coordinate arrays."""
+    unit_x, unit_y = _star_unit_vertices(n)
 
+    xs = w / 2 + w * unit_x
+    ys = h / 2 + h * unit_y
 
-def star_stroke_points(id: str, shape: StarGeoShape) -> List[StrokePoint]:
-    size = shape.size
+    return xs, ys
 
-    width = size.width
-    height = size.height
 
-    stroke_width = STROKE_WIDTHS[shape.style.size]
+def get_star_points(w: float, h: float, n: int) -> List[Position]:
+    xs, ys = _star_vertices(w, h, n)
+    return [Position(x, y) for x, y in zip(xs, ys)]
 
-    width = max(0, shape.size.width)
-    height = max(0, shape.size.height)
 
+# The stroke geometry is a pure function of the shape id (which seeds the
+# PRNG) and its dimensions, so it can be memoized across frames.
+@lru_cache(maxsize=512)
+def _star_stroke_points(
+    id: str, width: float, height: float, stroke_width: float
+) -> List[StrokePoint]:
     vertices = 5
 
-    star_points = get_star_points(width, height, vertices)
-    strokes = []
-
-    for i in range(len(star_points)):
-        pos1 = star_points[i]
-        pos2 = star_points[(i + 1) % len(star_points)]
-        distance = ((pos2.x - pos1.x) ** 2 + (pos2.y - pos1.y) ** 2) ** 0.5
-        strokes.append((pos1, pos2, distance))
-
-    points = get_polygon_draw_vertices(strokes, stroke_width, id)
+    # Pass the vertex coordinates straight through; the edge pairing and
+    # lengths the old stroke tuples carried were never consumed.
+    xs, ys = _star_vertices(width, height, vertices)
+    points = get_polygon_draw_vertices(tuple(zip(xs, ys)), stroke_width, id)
 
     return perfect_freehand.get_stroke_points(
         points, size=stroke_width, streamline=0.3, last=True
     )
 
 
+@lru_cache(maxsize=512)
+def _star_outline_points(
+    id: str, width: float, height: float, stroke_width: float
+) -> List[Tuple[float, float]]:
+    return perfect_freehand.get_stroke_outline_points(
+        _star_stroke_points(id, width, height, stroke_width),
+        size=stroke_width,
+        thinning=0.65,
+        smoothing=1,
+        simulate_pressure=False,
+        last=True,
+    )
+
+
+def star_stroke_points(id: str, shape: StarGeoShape) -> List[StrokePoint]:
+    return _star_stroke_points(
+        id,
+        max(0, shape.size.width),
+        max(0, shape.size.height),
+        shape.style.stroke_width,
+    )
+
+
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_star(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: StarGeoShape
 ) -> None:
     style = shape.style
 
-    stroke = STROKES[style.color]
-    stroke_width = STROKE_WIDTHS[style.size]
+    stroke = style.stroke
+    stroke_width = style.stroke_width
+
+    width = max(0, shape.size.width)
+    height = max(0, shape.size.height)
+
+    # A star smaller than the brush is all overlap: the freehand outline
+    # degenerates into a blob the width of the stroke. Fill and stroke the
+    # plain polygon instead of running perfect_freehand at all.
+    if min(width, height) < 2 * stroke_width:
+        xs, ys = _star_vertices(width, height, 5)
+        ctx.move_to(xs[0], ys[0])
+        for x, y in zip(xs[1:], ys[1:]):
+            ctx.line_to(x, y)
+        ctx.close_path()
+
+        if style.isFilled:
+            apply_geo_fill(ctx, style, preserve_path=True)
+
+        ctx.set_source_rgba(stroke.r, stroke.g, stroke.b, style.opacity)
+        ctx.fill_preserve()
+        ctx.set_line_width(stroke_width)
+        ctx.set_line_cap(cairo.LineCap.ROUND)
+        ctx.set_line_join(cairo.LineJoin.ROUND)
+        ctx.stroke()
+        return
 
     stroke_points = star_stroke_points(id, shape)
 
@@ -93,13 +141,8 @@ def draw_star(
         draw_smooth_stroke_point_path(ctx, stroke_points, closed=False)
         apply_geo_fill(ctx, style)
 
-    stroke_outline_points = perfect_freehand.get_stroke_outline_points(
-        stroke_points,
-        size=stroke_width,
-        thinning=0.65,
-        smoothing=1,
-        simulate_pressure=False,
-        last=True,
+    stroke_outline_points = _star_outline_points(
+        id, max(0, shape.size.width), max(0, shape.size.height), stroke_width
     )
     draw_smooth_path(ctx, stroke_outline_points, closed=True)
 
@@ -117,15 +160,22 @@ def dash_star(ctx: cairo.Context[CairoSomeSurface], shape: StarGeoShape) -> None
     height = max(0, shape.size.height)
 
     vertices = 5
-    points = get_star_points(width, height, vertices)
+    xs, ys = _star_vertices(width, height, vertices)
+    points = [Position(x, y) for x, y in zip(xs, ys)]
+
+    # The edge lengths come straight off the coordinate arrays, saving
+    # finalize_geo_path its per-edge distance loop over Position objects.
+    perimeter = float(
+        np.hypot(np.diff(xs, append=xs[0]), np.diff(ys, append=ys[0])).sum()
+    )
 
-    finalize_geo_path(ctx, points, style)
+    finalize_geo_path(ctx, points, style, perimeter=perimeter)
 
 
 def finalize_star(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: StarGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Star: {id}")
+    logger.debug("Tldraw: Finalizing Star: %s", id)
 
     style = shape.style
 
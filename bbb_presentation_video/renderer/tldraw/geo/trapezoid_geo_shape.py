@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from random import Random
 from typing import List, TypeVar
 
@@ -85,6 +86,8 @@ def trapezoid_stroke_points(id: str, shape: TrapezoidGeoShape) -> List[StrokePoi
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_trapezoid(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: TrapezoidGeoShape
@@ -141,7 +144,7 @@ def dash_trapezoid(
 def finalize_trapezoid(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: TrapezoidGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Trapezoid: {id}")
+    logger.debug("Tldraw: Finalizing Trapezoid: %s", id)
 
     style = shape.style
 
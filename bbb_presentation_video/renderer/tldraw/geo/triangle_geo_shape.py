@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from random import Random
 from typing import List, TypeVar
 
@@ -77,6 +78,8 @@ def triangle_stroke_points(id: str, shape: TriangleGeoShape) -> List[StrokePoint
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_triangle(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: TriangleGeoShape
@@ -131,7 +134,7 @@ def dash_triangle(
 def finalize_geo_triangle(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: TriangleGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Triangle (geo): {id}")
+    logger.debug("Tldraw: Finalizing Triangle (geo): %s", id)
 
     style = shape.style
     size = shape.size
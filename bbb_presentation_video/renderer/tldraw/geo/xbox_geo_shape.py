@@ -4,20 +4,19 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TypeVar
 
 import cairo
-import perfect_freehand
 
 from bbb_presentation_video.events.helpers import Position
 from bbb_presentation_video.renderer.tldraw.geo.rectangle_geo_shape import (
+    rectangle_outline_points,
     rectangle_stroke_points,
 )
 from bbb_presentation_video.renderer.tldraw.shape import XBoxGeoShape
 from bbb_presentation_video.renderer.tldraw.shape.text_v2 import finalize_v2_label
 from bbb_presentation_video.renderer.tldraw.utils import (
-    STROKE_WIDTHS,
-    STROKES,
     DashStyle,
     apply_geo_fill,
     draw_smooth_path,
@@ -27,9 +26,11 @@ from bbb_presentation_video.renderer.tldraw.utils import (
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def overlay_x_cross(ctx: cairo.Context[CairoSomeSurface], shape: XBoxGeoShape) -> None:
-    sw = STROKE_WIDTHS[shape.style.size]
+    sw = shape.style.stroke_width
 
     # Dimensions
     w = max(0, shape.size.width)
@@ -60,22 +61,15 @@ def draw_x_box(
 ) -> None:
     style = shape.style
     is_filled = style.isFilled
-    stroke = STROKES[style.color]
-    stroke_width = STROKE_WIDTHS[style.size]
+    stroke = style.stroke
+    stroke_width = style.stroke_width
     stroke_points = rectangle_stroke_points(id, shape)
 
     if is_filled:
         draw_smooth_stroke_point_path(ctx, stroke_points, closed=False)
         apply_geo_fill(ctx, style)
 
-    stroke_outline_points = perfect_freehand.get_stroke_outline_points(
-        stroke_points,
-        size=stroke_width,
-        thinning=0.65,
-        smoothing=1,
-        simulate_pressure=False,
-        last=True,
-    )
+    stroke_outline_points = rectangle_outline_points(id, shape)
 
     draw_smooth_path(ctx, stroke_outline_points, closed=True)
 
@@ -102,14 +96,14 @@ def dash_x_box(ctx: cairo.Context[CairoSomeSurface], shape: XBoxGeoShape) -> Non
         Position(0, h),
     ]
 
-    finalize_geo_path(ctx, points, style)
+    finalize_geo_path(ctx, points, style, perimeter=2 * (w + h))
     overlay_x_cross(ctx, shape)
 
 
 def finalize_x_box(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: XBoxGeoShape
 ) -> None:
-    print(f"\tTldraw: Finalizing x-box: {id}")
+    logger.debug("Tldraw: Finalizing x-box: %s", id)
 
     ctx.rotate(shape.rotation)
 
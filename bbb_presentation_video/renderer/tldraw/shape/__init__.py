@@ -4,7 +4,19 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Protocol, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import attr
 import cairo
@@ -23,6 +35,57 @@ from bbb_presentation_video.renderer.tldraw.utils import (
 
 BaseShapeSelf = TypeVar("BaseShapeSelf", bound="BaseShapeProto")
 
+ShapeUpdater = Callable[[Any, ShapeData, Any], None]
+"""A per-field update handler: receives the shape, the full data dict (for
+fields like ``x``/``y`` that combine with a sibling key), and the value."""
+
+
+def _update_style(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.style.update_from_data(value)
+
+
+def _update_child_index(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.childIndex = value
+
+
+def _update_children(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.children = value
+
+
+def _update_point(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.point = Position(value[0], value[1])
+
+
+def _update_x(shape: Any, data: ShapeData, value: Any) -> None:
+    # The position is only taken from "x"/"y" when both are present and no
+    # "point" entry takes precedence.
+    if "point" not in data and "y" in data:
+        shape.point = Position(value, data["y"])
+
+
+def _update_opacity(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.style.opacity = value
+
+
+def _update_parent_id(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.parentId = value
+
+
+def _update_size(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.size = Size(value)
+
+
+def _update_rotation(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.rotation = value
+
+
+def _update_label(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.label = value if value != "" else None
+
+
+def _update_label_point(shape: Any, data: ShapeData, value: Any) -> None:
+    shape.labelPoint = Position(value)
+
 
 @attr.s(order=False, slots=True, auto_attribs=True)
 class BaseShapeProto(Protocol):
@@ -43,6 +106,23 @@ class BaseShapeProto(Protocol):
     children: List[Shape] = []
     """List of children shapes."""
 
+    _updaters: ClassVar[Dict[str, ShapeUpdater]] = {
+        "style": _update_style,
+        "props": _update_style,
+        "childIndex": _update_child_index,
+        "children": _update_children,
+        "point": _update_point,
+        "x": _update_x,
+        "opacity": _update_opacity,
+        "parentId": _update_parent_id,
+    }
+    """Dispatch table for :meth:`update_from_data`.
+
+    Updates typically carry only one or two fields, so iterating the data
+    once with a dict lookup per key beats a membership test per known field.
+    Subclasses whose extra fields need no nested handling extend this table
+    instead of overriding the method."""
+
     @classmethod
     def from_data(cls: Type[BaseShapeSelf], data: ShapeData) -> BaseShapeSelf:
         shape = cls()
@@ -50,30 +130,11 @@ class BaseShapeProto(Protocol):
         return shape
 
     def update_from_data(self, data: ShapeData) -> None:
-        if "style" in data:
-            self.style.update_from_data(data["style"])
-
-        if "props" in data:
-            self.style.update_from_data(data["props"])
-
-        if "childIndex" in data:
-            self.childIndex = data["childIndex"]
-
-        if "children" in data:
-            self.children = data["children"]
-
-        if "point" in data:
-            point = data["point"]
-            self.point = Position(point[0], point[1])
-
-        elif "x" in data and "y" in data:
-            self.point = Position(data["x"], data["y"])
-
-        if "opacity" in data:
-            self.style.opacity = data["opacity"]
-
-        if "parentId" in data:
-            self.parentId = data["parentId"]
+        updaters = self._updaters
+        for key, value in data.items():
+            handler = updaters.get(key)
+            if handler is not None:
+                handler(self, data, value)
 
 
 @attr.s(order=False, slots=True, auto_attribs=True)
@@ -83,12 +144,14 @@ class SizedShapeProto(BaseShapeProto, Protocol):
     size: Size = Size(0, 0)
     """Precalculated bounding box of the shape."""
 
+    _updaters: ClassVar[Dict[str, ShapeUpdater]] = {
+        **BaseShapeProto._updaters,
+        "size": _update_size,
+    }
+
     def update_from_data(self, data: ShapeData) -> None:
         super().update_from_data(data)
 
-        if "size" in data:
-            self.size = Size(data["size"])
-
         if "props" in data:
             props = data["props"]
 
@@ -106,11 +169,10 @@ class RotatableShapeProto(SizedShapeProto, Protocol):
     rotation: float = 0
     """Rotation of the shape, in radians clockwise."""
 
-    def update_from_data(self, data: ShapeData) -> None:
-        super().update_from_data(data)
-
-        if "rotation" in data:
-            self.rotation = data["rotation"]
+    _updaters: ClassVar[Dict[str, ShapeUpdater]] = {
+        **SizedShapeProto._updaters,
+        "rotation": _update_rotation,
+    }
 
 
 @attr.s(order=False, slots=True, auto_attribs=True)
@@ -135,13 +197,15 @@ class LabelledShapeProto(RotatableShapeProto, Protocol):
             (self.labelPoint.y - 0.5) * self.size.height,
         )
 
+    _updaters: ClassVar[Dict[str, ShapeUpdater]] = {
+        **RotatableShapeProto._updaters,
+        "label": _update_label,
+        "labelPoint": _update_label_point,
+    }
+
     def update_from_data(self, data: ShapeData) -> None:
         super().update_from_data(data)
 
-        if "label" in data:
-            self.label = data["label"] if data["label"] != "" else None
-        if "labelPoint" in data:
-            self.labelPoint = Position(data["labelPoint"])
         if "props" in data:
             props = data["props"]
 
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from math import floor, pi, tau
 from random import Random
 from typing import Callable, List, Optional, Sequence, TypeVar
@@ -43,6 +44,8 @@ from bbb_presentation_video.renderer.tldraw.utils import (
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def freehand_arrow_shaft(
     ctx: cairo.Context[CairoSomeSurface],
@@ -141,7 +144,7 @@ def straight_arrow_head(
 ) -> None:
     ints = intersect_circle_line_segment(a, r, a, b).points
     if len(ints) == 0:
-        print("\t\tCould not find an intersection for the arrow head.")
+        logger.warning("Could not find an intersection for the arrow head.")
         left = a
         right = a
     else:
@@ -164,7 +167,7 @@ def curved_arrow_head(
 ) -> None:
     ints = intersect_circle_circle(a, r1 * 0.618, C, r2).points
     if len(ints) == 0:
-        print("\t\tCould not find an intersection for the arrow head.")
+        logger.warning("Could not find an intersection for the arrow head.")
         left = a
         right = a
     else:
@@ -312,7 +315,7 @@ def curved_arrow(
 def finalize_arrow(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: ArrowShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Arrow: {id}")
+    logger.debug("Tldraw: Finalizing Arrow: %s", id)
 
     apply_shape_rotation(ctx, shape)
 
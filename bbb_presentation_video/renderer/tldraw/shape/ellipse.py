@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from math import cos, pi, sin, tau
 from random import Random
 from typing import List, Tuple, TypeVar
@@ -68,6 +69,8 @@ def draw_stroke_points(
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_ellipse(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: EllipseShape
@@ -140,7 +143,7 @@ def dash_ellipse(ctx: cairo.Context[CairoSomeSurface], shape: EllipseShape) -> N
 def finalize_ellipse(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: EllipseShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Ellipse: {id}")
+    logger.debug("Tldraw: Finalizing Ellipse: %s", id)
 
     apply_shape_rotation(ctx, shape)
 
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from math import tau
 from typing import TypeVar
 
@@ -24,11 +25,13 @@ from bbb_presentation_video.renderer.tldraw.utils import (
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def finalize_highlight(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: HighlighterShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Highlight: {id}")
+    logger.debug("Tldraw: Finalizing Highlight: %s", id)
 
     apply_shape_rotation(ctx, shape)
 
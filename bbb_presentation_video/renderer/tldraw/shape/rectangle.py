@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from math import floor
 from random import Random
 from typing import List, Tuple, TypeVar
@@ -100,6 +101,8 @@ def rectangle_stroke_points(
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_rectangle(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: RectangleShape
@@ -178,7 +181,7 @@ def dash_rectangle(ctx: cairo.Context[CairoSomeSurface], shape: RectangleShape)
 def finalize_rectangle(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: RectangleShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Rectangle: {id}")
+    logger.debug("Tldraw: Finalizing Rectangle: %s", id)
 
     apply_shape_rotation(ctx, shape)
 
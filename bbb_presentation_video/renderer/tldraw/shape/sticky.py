@@ -16,6 +16,7 @@ from bbb_presentation_video.renderer.tldraw.shape import (
 from bbb_presentation_video.renderer.tldraw.shape.text import finalize_sticky_text
 from bbb_presentation_video.renderer.tldraw.utils import (
     STICKY_FILLS,
+    STROKES,
     ColorStyle,
     rounded_rect,
 )
@@ -29,6 +30,7 @@ def finalize_sticky(ctx: cairo.Context[CairoSomeSurface], shape: StickyShape) ->
     style = shape.style
     if style.color is ColorStyle.WHITE or style.color is ColorStyle.BLACK:
         style.color = ColorStyle.YELLOW
+        style.stroke = STROKES[style.color]
     fill = STICKY_FILLS[style.color]
 
     # Shadow. Doing blurred shadow is hard, so this is a simple offset drop shadow + border instead
@@ -13,6 +13,7 @@ from bbb_presentation_video.renderer.tldraw.shape import StickyShapeV2
 from bbb_presentation_video.renderer.tldraw.shape.text_v2 import finalize_sticky_text_v2
 from bbb_presentation_video.renderer.tldraw.utils import (
     STICKY_FILLS,
+    STROKES,
     ColorStyle,
     rounded_rect,
 )
@@ -27,6 +28,7 @@ def finalize_sticky_v2(
 
     if style.color is ColorStyle.BLACK:
         style.color = ColorStyle.YELLOW
+        style.stroke = STROKES[style.color]
 
     fill = STICKY_FILLS[style.color]
     ctx.rotate(shape.rotation)
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
+import logging
 from math import ceil
 from typing import Callable, Optional, Tuple, TypeVar
 
@@ -38,6 +39,8 @@ DPI: float = 72.0
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def create_pango_layout(
     ctx: cairo.Context[CairoSomeSurface],
@@ -160,7 +163,7 @@ def get_layout_size(layout: Pango.Layout, *, padding: float = 0) -> Size:
 def finalize_text(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: TextShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Text: {id}")
+    logger.debug("Tldraw: Finalizing Text: %s", id)
 
     apply_shape_rotation(ctx, shape)
 
@@ -185,7 +188,7 @@ def finalize_label(
     if shape.label is None or shape.label == "":
         return (Size(16, 32), 1)
 
-    print(f"\t\tFinalizing Label")
+    logger.debug("Finalizing Label")
 
     style = shape.style
     # Label text is always centered
@@ -231,7 +234,7 @@ def finalize_sticky_text(
     if shape.text is None or shape.text == "":
         return
 
-    print(f"\t\tFinalizing Sticky Text")
+    logger.debug("Finalizing Sticky Text")
 
     style = shape.style
     font_size = STICKY_FONT_SIZES[style.size]
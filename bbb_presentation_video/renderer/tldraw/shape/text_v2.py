@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
+import logging
 from typing import Optional, TypeVar
 
 import cairo
@@ -37,11 +38,13 @@ TEXT_OUTLINE_WIDTH: float = 2.0
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def finalize_v2_text(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: TextShapeV2
 ) -> None:
-    print(f"\tTldraw: Finalizing Text (v2): {id}")
+    logger.debug("Tldraw: Finalizing Text (v2): %s", id)
 
     style = shape.style
     stroke = STROKES[style.color]
@@ -83,7 +86,7 @@ def finalize_v2_label(
     if shape.label is None or shape.label == "":
         return Size(16, 32)
 
-    print(f"\t\tFinalizing Label (v2)")
+    logger.debug("Finalizing Label (v2)")
 
     style = shape.style
     stroke = STROKES[ColorStyle.BLACK]  # v2 labels are always black
@@ -145,7 +148,7 @@ def finalize_frame_name(
     if shape.label is None or shape.label == "":
         return Size(0, 0)
 
-    print(f"\t\tFinalizing Frame name")
+    logger.debug("Finalizing Frame name")
 
     style = shape.style
     stroke = STROKES[ColorStyle.BLACK]
@@ -186,7 +189,7 @@ def finalize_sticky_text_v2(
     if shape.text is None or shape.text == "":
         return
 
-    print(f"\t\tFinalizing Sticky Text (v2)")
+    logger.debug("Finalizing Sticky Text (v2)")
 
     style = shape.style
 
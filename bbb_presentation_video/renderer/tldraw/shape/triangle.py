@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import logging
 from math import hypot
 from random import Random
 from typing import List, TypeVar
@@ -81,6 +82,8 @@ def triangle_stroke_points(id: str, shape: TriangleShape) -> List[StrokePoint]:
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
+logger = logging.getLogger(__name__)
+
 
 def draw_triangle(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: TriangleShape
@@ -164,7 +167,7 @@ def dash_triangle(ctx: cairo.Context[CairoSomeSurface], shape: TriangleShape) ->
 def finalize_triangle(
     ctx: cairo.Context[CairoSomeSurface], id: str, shape: TriangleShape
 ) -> None:
-    print(f"\tTldraw: Finalizing Triangle: {id}")
+    logger.debug("Tldraw: Finalizing Triangle: %s", id)
 
     style = shape.style
     size = shape.size
@@ -6,12 +6,24 @@ from __future__ import annotations
 
 import math
 from enum import Enum
+from functools import lru_cache
+from hashlib import blake2b
 from math import cos, floor, hypot, pi, sin, sqrt, tau
-from random import Random
-from typing import Dict, List, Sequence, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import attr
 import cairo
+import numpy as np
 import perfect_freehand
 
 from bbb_presentation_video.events.helpers import Color, Position, Size, color_blend
@@ -27,6 +39,7 @@ STICKY_TEXT_COLOR: Color = Color.from_int(0x0D0D0D)
 STICKY_PADDING: float = 16.0
 
 
+# Enum values are the style strings used in tldraw shape data.
 class SizeStyle(Enum):
     SMALL: str = "small"
     S: str = "s"
@@ -70,6 +83,7 @@ STICKY_FONT_SIZES: Dict[SizeStyle, float] = {
 LETTER_SPACING: float = -0.03  # em
 
 
+# Enum values are the style strings used in tldraw shape data.
 class ColorStyle(Enum):
     WHITE: str = "white"
     LIGHT_GRAY: str = "lightGray"
@@ -128,44 +142,33 @@ HIGHLIGHT_COLORS: Dict[ColorStyle, Color] = {
 }
 
 
-STICKY_FILLS: Dict[ColorStyle, Color] = dict(
-    [
-        (
-            k,
-            (
-                Color.from_int(0xFFFFFF)
-                if k is ColorStyle.WHITE
-                else (
-                    Color.from_int(0x3D3D3D)
-                    if k is ColorStyle.BLACK
-                    else color_blend(v, CANVAS, 0.45)
-                )
-            ),
-        )
-        for k, v in COLORS.items()
-    ]
-)
+def _build_palettes() -> (
+    Tuple[Dict[ColorStyle, Color], Dict[ColorStyle, Color], Dict[ColorStyle, Color]]
+):
+    """Derive the sticky-fill, stroke, and fill palettes from COLORS in one
+    pass, with the white (and for stickies, black) overrides applied."""
+    sticky_fills: Dict[ColorStyle, Color] = {}
+    strokes: Dict[ColorStyle, Color] = {}
+    fills: Dict[ColorStyle, Color] = {}
 
-STROKES: Dict[ColorStyle, Color] = dict(
-    [
-        (k, Color.from_int(0x1D1D1D) if k is ColorStyle.WHITE else v)
-        for k, v in COLORS.items()
-    ]
-)
+    for k, v in COLORS.items():
+        if k is ColorStyle.WHITE:
+            sticky_fills[k] = Color.from_int(0xFFFFFF)
+            strokes[k] = Color.from_int(0x1D1D1D)
+            fills[k] = Color.from_int(0xFEFEFE)
+        else:
+            sticky_fills[k] = (
+                Color.from_int(0x3D3D3D)
+                if k is ColorStyle.BLACK
+                else color_blend(v, CANVAS, 0.45)
+            )
+            strokes[k] = v
+            fills[k] = color_blend(v, CANVAS, 0.82)
 
-FILLS: Dict[ColorStyle, Color] = dict(
-    [
-        (
-            k,
-            (
-                Color.from_int(0xFEFEFE)
-                if k is ColorStyle.WHITE
-                else color_blend(v, CANVAS, 0.82)
-            ),
-        )
-        for k, v in COLORS.items()
-    ]
-)
+    return sticky_fills, strokes, fills
+
+
+STICKY_FILLS, STROKES, FILLS = _build_palettes()
 
 
 class DashStyle(Enum):
@@ -210,6 +213,79 @@ class FillStyle(Enum):
     PATTERN: str = "pattern"
 
 
+# Plain value-to-member maps for the enums the style setters construct.
+# Indexing these skips EnumMeta.__call__, which costs several Python frames
+# per conversion and runs for every field of every style update.
+_COLOR_BY_VALUE: Dict[str, ColorStyle] = {c.value: c for c in ColorStyle}
+_SIZE_BY_VALUE: Dict[str, SizeStyle] = {s.value: s for s in SizeStyle}
+_DASH_BY_VALUE: Dict[str, DashStyle] = {d.value: d for d in DashStyle}
+_FONT_BY_VALUE: Dict[str, FontStyle] = {f.value: f for f in FontStyle}
+_ALIGN_BY_VALUE: Dict[str, AlignStyle] = {a.value: a for a in AlignStyle}
+_FILL_BY_VALUE: Dict[str, FillStyle] = {f.value: f for f in FillStyle}
+
+
+def _style_set_color(style: Style, value: Any) -> None:
+    style.color = _COLOR_BY_VALUE[value]
+
+
+def _style_set_size(style: Style, value: Any) -> None:
+    style.size = _SIZE_BY_VALUE[value]
+
+
+def _style_set_dash(style: Style, value: Any) -> None:
+    style.dash = _DASH_BY_VALUE[value]
+
+
+def _style_set_is_filled(style: Style, value: Any) -> None:
+    style.isFilled = value
+
+
+def _style_set_scale(style: Style, value: Any) -> None:
+    style.scale = value
+
+
+def _style_set_font(style: Style, value: Any) -> None:
+    style.font = _FONT_BY_VALUE[value]
+
+
+def _style_set_text_align(style: Style, value: Any) -> None:
+    style.textAlign = _ALIGN_BY_VALUE[value]
+
+
+def _style_set_opacity(style: Style, value: Any) -> None:
+    style.opacity = value
+
+
+def _style_set_is_closed(style: Style, value: Any) -> None:
+    style.isClosed = value
+
+
+def _style_set_fill(style: Style, value: Any) -> None:
+    style.fill = _FILL_BY_VALUE[value]
+    if style.fill is not FillStyle.NONE:
+        style.isFilled = True
+
+
+_STYLE_SETTERS: Dict[str, Callable[["Style", Any], None]] = {
+    "color": _style_set_color,
+    "size": _style_set_size,
+    "dash": _style_set_dash,
+    "isFilled": _style_set_is_filled,
+    "scale": _style_set_scale,
+    "font": _style_set_font,
+    "textAlign": _style_set_text_align,
+    "opacity": _style_set_opacity,
+    # Tldraw v2 style props not present in v1
+    "isClosed": _style_set_is_closed,
+    "fill": _style_set_fill,
+}
+"""Dispatch table for Style.update_from_data.
+
+Style updates (and the v2 props dicts routed through them) rarely carry
+every field, so one pass over data.items() with a dict probe per key beats
+a membership test plus fetch for each known field."""
+
+
 @attr.s(order=False, slots=True, auto_attribs=True)
 class Style:
     color: ColorStyle = ColorStyle.BLACK
@@ -223,31 +299,30 @@ class Style:
     opacity: float = 1
     fill: FillStyle = FillStyle.NONE
 
+    stroke_width: float = attr.ib(init=False, eq=False, repr=False, default=0.0)
+    """The stroke width for the current size, cached off STROKE_WIDTHS."""
+    stroke: Color = attr.ib(
+        init=False, eq=False, repr=False, default=STROKES[ColorStyle.BLACK]
+    )
+    """The stroke color for the current color, cached off STROKES.
+
+    Both caches are derived state, excluded from comparisons, and refreshed by
+    update_from_data; code that assigns size or color directly must refresh
+    them as well."""
+
+    def __attrs_post_init__(self) -> None:
+        self.stroke_width = STROKE_WIDTHS[self.size]
+        self.stroke = STROKES[self.color]
+
     def update_from_data(self, data: StyleData) -> None:
-        if "color" in data:
-            self.color = ColorStyle(data["color"])
-        if "size" in data:
-            self.size = SizeStyle(data["size"])
-        if "dash" in data:
-            self.dash = DashStyle(data["dash"])
-        if "isFilled" in data:
-            self.isFilled = data["isFilled"]
-        if "scale" in data:
-            self.scale = data["scale"]
-        if "font" in data:
-            self.font = FontStyle(data["font"])
-        if "textAlign" in data:
-            self.textAlign = AlignStyle(data["textAlign"])
-        if "opacity" in data:
-            self.opacity = data["opacity"]
-
-        # Tldraw v2 style props not present in v1
-        if "isClosed" in data:
-            self.isClosed = data["isClosed"]
-        if "fill" in data:
-            self.fill = FillStyle(data["fill"])
-            if self.fill is not FillStyle.NONE:
-                self.isFilled = True
+        setters = _STYLE_SETTERS
+        for key, value in data.items():
+            setter = setters.get(key)
+            if setter is not None:
+                setter(self, value)
+
+        self.stroke_width = STROKE_WIDTHS[self.size]
+        self.stroke = STROKES[self.color]
 
 
 class Decoration(Enum):
@@ -300,6 +375,16 @@ def perimeter_of_ellipse(rx: float, ry: float) -> float:
     return pi * (rx + ry) * (1 + (3 * h) / (10 + sqrt(4 - 3 * h)))
 
 
+def rng_from_id(id: str) -> np.random.Generator:
+    """A deterministic per-shape random generator.
+
+    Seeding numpy's Generator from a short digest of the shape id is much
+    cheaper than random.Random's string seeding, and the vectorized draws
+    replace many per-value method calls."""
+    seed = int.from_bytes(blake2b(id.encode("utf-8"), digest_size=8).digest(), "big")
+    return np.random.default_rng(seed)
+
+
 def circle_from_three_points(
     A: Sequence[float], B: Sequence[float], C: Sequence[float]
 ) -> Tuple[Position, float]:
@@ -308,32 +393,31 @@ def circle_from_three_points(
     (x2, y2) = B
     (x3, y3) = C
 
+    # The squared magnitudes feed both determinants; compute them once.
+    s1 = x1 * x1 + y1 * y1
+    s2 = x2 * x2 + y2 * y2
+    s3 = x3 * x3 + y3 * y3
+
     a = x1 * (y2 - y3) - y1 * (x2 - x3) + x2 * y3 - x3 * y2
 
-    b = (
-        (x1 * x1 + y1 * y1) * (y3 - y2)
-        + (x2 * x2 + y2 * y2) * (y1 - y3)
-        + (x3 * x3 + y3 * y3) * (y2 - y1)
-    )
+    b = s1 * (y3 - y2) + s2 * (y1 - y3) + s3 * (y2 - y1)
 
-    c = (
-        (x1 * x1 + y1 * y1) * (x2 - x3)
-        + (x2 * x2 + y2 * y2) * (x3 - x1)
-        + (x3 * x3 + y3 * y3) * (x1 - x2)
-    )
+    c = s1 * (x2 - x3) + s2 * (x3 - x1) + s3 * (x1 - x2)
+
+    d = 2 * a
 
-    x = -b / (2 * a)
+    x = -b / d
 
-    y = -c / (2 * a)
+    y = -c / d
 
     return (Position(x, y), hypot(x - x1, y - y1))
 
 
 def short_angle_dist(a0: float, a1: float) -> float:
     """Get the short angle distance between two angles."""
-    max = math.pi * 2
-    da = (a1 - a0) % max
-    return ((2 * da) % max) - da
+    # The IEEE-754 remainder lands in [-pi, pi], which is exactly the short
+    # angular distance, in one libm call instead of two float modulos.
+    return math.remainder(a1 - a0, tau)
 
 
 def lerp_angles(a0: float, a1: float, t: float) -> float:
@@ -357,24 +441,27 @@ def draw_stroke_points(
     )
 
 
-def get_perfect_dash_props(
+# Shared result for the solid styles, so the common case allocates nothing.
+_SOLID_DASH_PROPS: Tuple[List[float], float] = ([], 0)
+
+
+@lru_cache(maxsize=1024)
+def _perfect_dash_props(
     length: float,
     stroke_width: float,
     style: DashStyle,
-    snap: int = 1,
-    outset: bool = True,
-    length_ratio: float = 2,
+    snap: int,
+    outset: bool,
+    length_ratio: float,
 ) -> Tuple[List[float], float]:
     if style is DashStyle.DASHED:
         dash_length = stroke_width * length_ratio
         ratio = 1
         offset = dash_length / 2 if outset else 0
-    elif style is DashStyle.DOTTED:
+    else:
         dash_length = stroke_width / 100
         ratio = 100
         offset = 0
-    else:
-        return ([], 0)
 
     dashes = floor(length / dash_length / (2 * ratio))
     dashes -= dashes % snap
@@ -388,6 +475,26 @@ def get_perfect_dash_props(
     return ([dash_length, gap_length], offset)
 
 
+def get_perfect_dash_props(
+    length: float,
+    stroke_width: float,
+    style: DashStyle,
+    snap: int = 1,
+    outset: bool = True,
+    length_ratio: float = 2,
+) -> Tuple[List[float], float]:
+    if style is not DashStyle.DASHED and style is not DashStyle.DOTTED:
+        return _SOLID_DASH_PROPS
+
+    # Quantizing the length to a tenth of a pixel makes repeat edges of
+    # near-identical lengths share a cache entry; the visual difference is
+    # far below what a dash gap can show. Callers hand the dash list
+    # straight to ctx.set_dash, so sharing the cached list is safe.
+    return _perfect_dash_props(
+        round(length, 1), stroke_width, style, snap, outset, length_ratio
+    )
+
+
 def bezier_quad_to_cube(
     qp0: Tuple[float, float], qp1: Tuple[float, float], qp2: Tuple[float, float]
 ) -> Tuple[Tuple[float, float], Tuple[float, float]]:
@@ -397,49 +504,52 @@ def bezier_quad_to_cube(
     )
 
 
+@lru_cache(maxsize=8)
+def _bezier_basis(num_segments: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cubic Bernstein basis sampled at num_segments + 1 parameter values.
+
+    The two middle terms are summed into one array because bezier_length
+    evaluates a cubic whose control points coincide."""
+    t = np.linspace(0.0, 1.0, num_segments + 1)
+    omt = 1.0 - t
+    return omt**3, 3.0 * omt**2 * t + 3.0 * omt * t**2, t**3
+
+
 def bezier_length(
     start: Position, control: Position, end: Position, num_segments: int = 10
 ) -> float:
     """Approximate the length of a cubic Bézier curve."""
-    length = 0.0
-    t_values = [i / num_segments for i in range(num_segments + 1)]
-    last_point = start
-
-    for t in t_values[1:]:
-        # Calculate the next point on the curve
-        x = (
-            (1 - t) ** 3 * start.x
-            + 3 * (1 - t) ** 2 * t * control.x
-            + 3 * (1 - t) * t**2 * control.x
-            + t**3 * end.x
-        )
-        y = (
-            (1 - t) ** 3 * start.y
-            + 3 * (1 - t) ** 2 * t * control.y
-            + 3 * (1 - t) * t**2 * control.y
-            + t**3 * end.y
-        )
-        next_point = Position(x, y)
+    b0, b12, b3 = _bezier_basis(num_segments)
 
-        # Add the distance from the last point to the current point
-        length += vec.dist(last_point, next_point)
-        last_point = next_point
+    xs = b0 * start.x + b12 * control.x + b3 * end.x
+    ys = b0 * start.y + b12 * control.y + b3 * end.y
 
-    return length
+    return float(np.hypot(np.diff(xs), np.diff(ys)).sum())
 
 
 CairoSomeSurface = TypeVar("CairoSomeSurface", bound=cairo.Surface)
 
 
-def rounded_rect(
-    ctx: cairo.Context[CairoSomeSurface], size: Size, radius: float
-) -> None:
+# Sticky notes share a handful of sizes, so the flattened arc path is built
+# once per (width, height, radius) and replayed with a single append_path.
+@lru_cache(maxsize=256)
+def _rounded_rect_path(width: float, height: float, radius: float) -> cairo.Path:
+    surface = cairo.RecordingSurface(cairo.Content.COLOR_ALPHA, None)
+    ctx = cairo.Context(surface)
     ctx.new_sub_path()
-    ctx.arc(size.width - radius, radius, radius, -tau / 4, 0)
-    ctx.arc(size.width - radius, size.height - radius, radius, 0, tau / 4)
-    ctx.arc(radius, size.height - radius, radius, tau / 4, tau / 2)
+    ctx.arc(width - radius, radius, radius, -tau / 4, 0)
+    ctx.arc(width - radius, height - radius, radius, 0, tau / 4)
+    ctx.arc(radius, height - radius, radius, tau / 4, tau / 2)
     ctx.arc(radius, radius, radius, tau / 2, -tau / 4)
     ctx.close_path()
+    return ctx.copy_path()
+
+
+def rounded_rect(
+    ctx: cairo.Context[CairoSomeSurface], size: Size, radius: float
+) -> None:
+    # The cached path already opens with its own move_to.
+    ctx.append_path(_rounded_rect_path(size.width, size.height, radius))
 
 
 def draw_smooth_path(
@@ -452,30 +562,49 @@ def draw_smooth_path(
     if len(points) < 1:
         return
 
-    prev_point = points[0]
+    # pycairo has no bulk path-construction API, so one curve_to call per
+    # point is unavoidable; inline the midpoint and quadratic-to-cubic math
+    # (cp = end + (control - end) * 2/3) and bind the method once to keep
+    # the loop free of temporary tuples and extra call frames.
+    curve_to = ctx.curve_to
+    two_thirds = 2 / 3
+
+    px, py = points[0][0], points[0][1]
     if closed:
-        prev_mid = vec.med(points[-1], prev_point)
+        pmx = (points[-1][0] + px) * 0.5
+        pmy = (points[-1][1] + py) * 0.5
     else:
-        prev_mid = prev_point
-    ctx.move_to(prev_mid[0], prev_mid[1])
+        pmx, pmy = px, py
+    ctx.move_to(pmx, pmy)
     for point in points[1:]:
-        mid = vec.med(prev_point, point)
-
-        # Cairo can't render quadratic curves directly, need to convert to cubic curves.
-        cp1, cp2 = bezier_quad_to_cube(prev_mid, prev_point, mid)
-        ctx.curve_to(cp1[0], cp1[1], cp2[0], cp2[1], mid[0], mid[1])
-        prev_point = point
-        prev_mid = mid
+        x, y = point[0], point[1]
+        mx = (px + x) * 0.5
+        my = (py + y) * 0.5
+        curve_to(
+            pmx + (px - pmx) * two_thirds,
+            pmy + (py - pmy) * two_thirds,
+            mx + (px - mx) * two_thirds,
+            my + (py - my) * two_thirds,
+            mx,
+            my,
+        )
+        px, py = x, y
+        pmx, pmy = mx, my
 
     if closed:
-        point = points[0]
-        mid = vec.med(prev_point, point)
+        mx = (px + points[0][0]) * 0.5
+        my = (py + points[0][1]) * 0.5
     else:
-        point = points[-1]
-        mid = point
-
-    cp1, cp2 = bezier_quad_to_cube(prev_mid, prev_point, mid)
-    ctx.curve_to(cp1[0], cp1[1], cp2[0], cp2[1], mid[0], mid[1])
+        mx, my = points[-1][0], points[-1][1]
+
+    curve_to(
+        pmx + (px - pmx) * two_thirds,
+        pmy + (py - pmy) * two_thirds,
+        mx + (px - mx) * two_thirds,
+        my + (py - my) * two_thirds,
+        mx,
+        my,
+    )
 
     if closed:
         ctx.close_path()
@@ -486,11 +615,65 @@ def draw_smooth_stroke_point_path(
     points: Sequence[perfect_freehand.types.StrokePoint],
     closed: bool = True,
 ) -> None:
-    outline_points = list(map(lambda p: p["point"], points))
-    draw_smooth_path(ctx, outline_points, closed)
+    """Like draw_smooth_path, but reading StrokePoint coordinates in place.
 
+    Duplicating the loop avoids materializing an intermediate coordinate
+    list (and a lambda call per point) for every freehand stroke."""
 
-def pattern_fill(fill: Color, opacity: float = 1) -> cairo.SurfacePattern:
+    if len(points) < 1:
+        return
+
+    curve_to = ctx.curve_to
+    two_thirds = 2 / 3
+
+    px, py = points[0]["point"]
+    if closed:
+        lx, ly = points[-1]["point"]
+        pmx = (lx + px) * 0.5
+        pmy = (ly + py) * 0.5
+    else:
+        pmx, pmy = px, py
+    ctx.move_to(pmx, pmy)
+    for point in points[1:]:
+        x, y = point["point"]
+        mx = (px + x) * 0.5
+        my = (py + y) * 0.5
+        curve_to(
+            pmx + (px - pmx) * two_thirds,
+            pmy + (py - pmy) * two_thirds,
+            mx + (px - mx) * two_thirds,
+            my + (py - my) * two_thirds,
+            mx,
+            my,
+        )
+        px, py = x, y
+        pmx, pmy = mx, my
+
+    if closed:
+        fx, fy = points[0]["point"]
+        mx = (px + fx) * 0.5
+        my = (py + fy) * 0.5
+    else:
+        mx, my = points[-1]["point"]
+
+    curve_to(
+        pmx + (px - pmx) * two_thirds,
+        pmy + (py - pmy) * two_thirds,
+        mx + (px - mx) * two_thirds,
+        my + (py - my) * two_thirds,
+        mx,
+        my,
+    )
+
+    if closed:
+        ctx.close_path()
+
+
+# The inputs come from a small discrete set (the FILLS palette times a few
+# opacities), so the tile surface is built once per combination. The repeating
+# pattern carries no per-draw state, making it safe to share between fills.
+@lru_cache(maxsize=64)
+def _pattern_fill(r: float, g: float, b: float, opacity: float) -> cairo.SurfacePattern:
     surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 8, 8)
     ctx = cairo.Context(surface)
 
@@ -504,7 +687,7 @@ def pattern_fill(fill: Color, opacity: float = 1) -> cairo.SurfacePattern:
     ctx.fill()
 
     ctx.set_line_cap(cairo.LINE_CAP_ROUND)
-    ctx.set_source_rgba(fill.r, fill.g, fill.b, opacity)
+    ctx.set_source_rgba(r, g, b, opacity)
 
     lines = [
         (0.66, 2, 2, 0.66),
@@ -525,25 +708,31 @@ def pattern_fill(fill: Color, opacity: float = 1) -> cairo.SurfacePattern:
     return pattern
 
 
+def pattern_fill(fill: Color, opacity: float = 1) -> cairo.SurfacePattern:
+    return _pattern_fill(fill.r, fill.g, fill.b, opacity)
+
+
 def get_arc_length(C: Position, r: float, A: Position, B: Position) -> float:
-    sweep = get_sweep(C, A, B)
-    return r * tau * (sweep / tau)
+    return r * get_sweep(C, A, B)
+
+
+# The semi fill ignores the shape's color entirely, so its color is a
+# constant rather than a per-fill lookup.
+_SEMI_FILL_COLOR: Color = COLORS[ColorStyle.SEMI]
 
 
 def apply_geo_fill(
     ctx: cairo.Context[CairoSomeSurface], style: Style, preserve_path: bool = False
 ) -> None:
-    fill = FILLS[style.color]
-
     if style.fill is FillStyle.SEMI:
-        fill = COLORS[ColorStyle.SEMI]
+        fill = _SEMI_FILL_COLOR
         ctx.set_source_rgba(fill.r, fill.g, fill.b, style.opacity)
 
     elif style.fill is FillStyle.PATTERN:
-        fill = FILLS[style.color]
-        pattern = pattern_fill(fill, style.opacity)
+        pattern = pattern_fill(FILLS[style.color], style.opacity)
         ctx.set_source(pattern)
     else:
+        fill = FILLS[style.color]
         ctx.set_source_rgba(fill.r, fill.g, fill.b, style.opacity)
 
     if preserve_path:
@@ -556,16 +745,32 @@ def finalize_geo_path(
     ctx: cairo.Context[CairoSomeSurface],
     points: List[Position],
     style: Style,
+    perimeter: Optional[float] = None,
 ) -> None:
+    """Fill and stroke a closed polygon outline.
 
-    if style.isFilled:
-        ctx.move_to(points[0].x, points[0].y)
+    Callers whose geometry makes the perimeter cheap to compute (e.g. equal
+    side lengths) can pass it in to skip the per-edge distance loop."""
 
-        for point in points[1:]:
-            ctx.line_to(point.x, point.y)
+    # Build the outline path once; it is reused for both fill and stroke.
+    ctx.move_to(points[0].x, points[0].y)
 
-        ctx.close_path()
-        apply_geo_fill(ctx, style)
+    for i in range(1, len(points)):
+        ctx.line_to(points[i].x, points[i].y)
+
+    ctx.close_path()
+
+    # The perimeter only matters when the dash pattern depends on it.
+    dist: float = 0
+    if perimeter is not None:
+        dist = perimeter
+    elif style.dash is DashStyle.DASHED or style.dash is DashStyle.DOTTED:
+        dist = sum(
+            vec.dist(points[i - 1], points[i]) for i in range(1, len(points))
+        ) + vec.dist(points[-1], points[0])
+
+    if style.isFilled:
+        apply_geo_fill(ctx, style, preserve_path=True)
 
     stroke = STROKES[style.color]
     stroke_width = STROKE_WIDTHS[style.size] * 1.618
@@ -577,42 +782,37 @@ def finalize_geo_path(
     ctx.set_line_join(cairo.LineJoin.ROUND)
     ctx.set_source_rgba(stroke.r, stroke.g, stroke.b, style.opacity)
 
-    dist: float = 0
-    ctx.move_to(points[0].x, points[0].y)
-
-    for i in range(1, len(points)):
-        dist += vec.dist(points[i - 1], points[i])
-        ctx.line_to(points[i].x, points[i].y)
-
-    dist += vec.dist(points[-1], points[0])
-    ctx.close_path()
-
     dash_array, dash_offset = get_perfect_dash_props(dist, stroke_width, style.dash)
 
     ctx.set_dash(dash_array, dash_offset)
     ctx.stroke()
 
 
+@lru_cache(maxsize=32)
+def _unit_polygon_points(sides: int) -> Tuple[Tuple[float, float], ...]:
+    """Unit-circle vertices of a regular polygon, starting at the top."""
+    step = tau / sides
+    return tuple(
+        (cos(-(tau / 4) + i * step), sin(-(tau / 4) + i * step)) for i in range(sides)
+    )
+
+
+@lru_cache(maxsize=512)
 def get_polygon_strokes(
     width: float, height: float, sides: int
 ) -> List[Tuple[Position, Position, float]]:
     cx = width / 2
     cy = height / 2
+    unit = _unit_polygon_points(sides)
     strokes = []
 
     for i in range(sides):
-        step = tau / sides
-        t = -(tau / 4) + i * step
-        x = cx + cx * cos(t)
-        y = cy + cy * sin(t)
-
-        next_t = -(tau / 4) + ((i + 1) % sides) * step
-        next_x = cx + cx * cos(next_t)
-        next_y = cy + cy * sin(next_t)
+        ux, uy = unit[i]
+        nx, ny = unit[(i + 1) % sides]
 
-        pos1 = Position(x, y)
-        pos2 = Position(next_x, next_y)
-        distance = ((pos2.x - pos1.x) ** 2 + (pos2.y - pos1.y) ** 2) ** 0.5
+        pos1 = Position(cx + cx * ux, cy + cy * uy)
+        pos2 = Position(cx + cx * nx, cy + cy * ny)
+        distance = hypot(pos2.x - pos1.x, pos2.y - pos1.y)
 
         strokes.append((pos1, pos2, distance))
 
@@ -632,27 +832,19 @@ def get_polygon_strokes(
 
 
 def get_polygon_draw_vertices(
-    strokes: List[Tuple[Position, Position, float]], stroke_width: float, id: str
+    vertices: Sequence[Tuple[float, float]], stroke_width: float, id: str
 ) -> List[Tuple[float, float, float]]:
-    random = Random(id)
-    # Generate vertices with added variation
+    rng = rng_from_id(id)
+    # Vertex jitter, drawn in one vectorized call
     variation = stroke_width * 0.75
-    v_points = [
-        (
-            stroke[0].x + random.uniform(-variation, variation),
-            stroke[0].y + random.uniform(-variation, variation),
-        )
-        for stroke in strokes
-    ]
+    offsets = rng.uniform(-variation, variation, size=(len(vertices), 2))
 
     # Determine the random start index for drawing
-    rm = random.randrange(0, len(v_points))
+    rm = int(rng.integers(0, len(vertices)))
 
-    # Generate lines between points with added variation
-    lines = [
-        vec.points_between(v_points[i], v_points[(i + 1) % len(v_points)], 32)
-        for i in range(len(v_points))
-    ]
+    # The un-jittered vertices are shared (and cached) across all polygons of
+    # this size; only the per-id jitter varies.
+    lines = vec.points_between_batch(vertices, 32, offsets=offsets)
 
     lines = lines[rm:] + lines[:rm]
 
@@ -3,8 +3,12 @@
 #
 # SPDX-License-Identifier: MIT
 
+from functools import lru_cache
 from math import atan2, cos, hypot, sin
-from typing import List, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 from bbb_presentation_video.events.helpers import Position
 
@@ -113,12 +117,51 @@ def nudge_at_angle(A: S, a: float, d: float) -> V:
 
 def points_between(a: S, b: S, steps: int = 6) -> List[Tuple[float, float, float]]:
     """Get an array of points (with simulated pressure) between two points."""
-    points: List[Tuple[float, float, float]] = []
-    for i in range(0, steps):
-        t = i / (steps - 1)
-        k = min(1, 0.5 + abs(0.5 - t))
-        points.append((*lrp(a, b, t), k))
-    return points
+    t = np.arange(steps, dtype=np.float64) / (steps - 1)
+    pts = np.empty((steps, 3))
+    pts[:, 0] = a[0] + (b[0] - a[0]) * t
+    pts[:, 1] = a[1] + (b[1] - a[1]) * t
+    pts[:, 2] = np.minimum(1.0, 0.5 + np.abs(0.5 - t))
+    return [(x, y, p) for x, y, p in pts.tolist()]
+
+
+@lru_cache(maxsize=512)
+def _edge_interpolants(corners: Tuple[V, ...], steps: int) -> np.ndarray:
+    """Cached un-jittered edge interpolants of a closed polygon."""
+    c = np.asarray(corners, dtype=np.float64)
+    t = np.arange(steps, dtype=np.float64) / (steps - 1)
+    deltas = np.roll(c, -1, axis=0) - c
+    return c[:, None, :] + deltas[:, None, :] * t[None, :, None]
+
+
+def points_between_batch(
+    corners: Sequence[S],
+    steps: int = 6,
+    offsets: Optional[npt.NDArray[np.float64]] = None,
+) -> List[List[Tuple[float, float, float]]]:
+    """Get the :func:`points_between` interpolants for every edge of a closed
+    polygon (wrapping from the last corner back to the first) as one array
+    operation instead of a Python loop per point.
+
+    The interpolants for the given corners are cached, so shapes that differ
+    only in per-id jitter should pass their shared base corners here and the
+    jitter as per-corner ``offsets``, which get interpolated onto the cached
+    base."""
+    key = tuple((float(c[0]), float(c[1])) for c in corners)
+    xy = _edge_interpolants(key, steps)
+    t = np.arange(steps, dtype=np.float64) / (steps - 1)
+    k = np.minimum(1.0, 0.5 + np.abs(0.5 - t))
+    if offsets is not None:
+        o = np.asarray(offsets, dtype=np.float64)
+        od = np.roll(o, -1, axis=0) - o
+        xy = xy + o[:, None, :] + od[:, None, :] * t[None, :, None]
+
+    # Assemble the (x, y, pressure) columns in one C-level pass; only the
+    # final tuple construction happens per point.
+    pts = np.empty((xy.shape[0], steps, 3))
+    pts[:, :, :2] = xy
+    pts[:, :, 2] = k
+    return [[(x, y, p) for x, y, p in edge] for edge in pts.tolist()]
 
 
 def to_position(a: S) -> Position:
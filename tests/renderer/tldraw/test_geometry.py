@@ -0,0 +1,171 @@
+import math
+
+import numpy as np
+
+from bbb_presentation_video.events.helpers import Position
+from bbb_presentation_video.renderer.tldraw import vec
+from bbb_presentation_video.renderer.tldraw.geo.cloud_geo_shape import (
+    _cloud_arcs_kernel,
+    get_cloud_arcs,
+    get_pill_points,
+)
+from bbb_presentation_video.renderer.tldraw.utils import (
+    DashStyle,
+    SizeStyle,
+    circle_from_three_points,
+    get_perfect_dash_props,
+    get_polygon_draw_vertices,
+    rng_from_id,
+)
+
+
+def test_points_between() -> None:
+    points = vec.points_between((1, 2), (7, 10), steps=5)
+
+    assert len(points) == 5
+    assert points[0] == (1, 2, 1)
+    assert points[-1] == (7, 10, 1)
+
+    for i, (x, y, pressure) in enumerate(points):
+        t = i / 4
+        assert math.isclose(x, 1 + 6 * t)
+        assert math.isclose(y, 2 + 8 * t)
+        assert pressure == min(1, 0.5 + abs(0.5 - t))
+
+
+def test_points_between_batch() -> None:
+    corners = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+    offsets = rng_from_id("shape:test").uniform(-1, 1, size=(4, 2))
+
+    lines = vec.points_between_batch(corners, 6, offsets=offsets)
+
+    assert len(lines) == 4
+    # Each edge matches points_between over the jittered corners, wrapping
+    # from the last corner back to the first.
+    for i, line in enumerate(lines):
+        a = np.asarray(corners[i]) + offsets[i]
+        b = np.asarray(corners[(i + 1) % 4]) + offsets[(i + 1) % 4]
+        expected = vec.points_between(a, b, 6)
+        assert len(line) == 6
+        for point, expected_point in zip(line, expected):
+            assert np.allclose(point, expected_point)
+
+
+def test_get_pill_points_horizontal() -> None:
+    width, height, num_points = 100.0, 40.0, 37
+    radius = height / 2
+    points = get_pill_points(width, height, num_points)
+
+    assert points.shape == (num_points, 2)
+    assert np.allclose(points[0], (radius, 0))
+
+    # Every sample must lie on the pill perimeter: one of the straight
+    # sides, or one of the two end cap circles.
+    for x, y in points:
+        on_top = math.isclose(y, 0, abs_tol=1e-9) and radius <= x <= width - radius
+        on_bottom = (
+            math.isclose(y, height, abs_tol=1e-9) and radius <= x <= width - radius
+        )
+        on_right_cap = math.isclose(
+            math.hypot(x - (width - radius), y - radius), radius
+        )
+        on_left_cap = math.isclose(math.hypot(x - radius, y - radius), radius)
+        assert on_top or on_bottom or on_right_cap or on_left_cap
+
+
+def test_get_pill_points_vertical() -> None:
+    width, height, num_points = 40.0, 100.0, 24
+    radius = width / 2
+    points = get_pill_points(width, height, num_points)
+
+    assert points.shape == (num_points, 2)
+    assert np.allclose(points[0], (width, radius))
+
+    for x, y in points:
+        on_right = (
+            math.isclose(x, width, abs_tol=1e-9) and radius <= y <= height - radius
+        )
+        on_left = math.isclose(x, 0, abs_tol=1e-9) and radius <= y <= height - radius
+        on_bottom_cap = math.isclose(
+            math.hypot(x - radius, y - (height - radius)), radius
+        )
+        on_top_cap = math.isclose(math.hypot(x - radius, y - radius), radius)
+        assert on_right or on_left or on_bottom_cap or on_top_cap
+
+
+def test_get_cloud_arcs() -> None:
+    arcs = get_cloud_arcs(200.0, 100.0, "shape:cloud", SizeStyle.M)
+
+    assert arcs.shape[1] == 9
+    assert arcs.shape[0] >= 6
+
+    for lx, ly, rx, ry, cx, cy, radius, start_angle, end_angle in arcs:
+        if math.isnan(cx):
+            continue
+        # The center must be equidistant from both bump points, and the
+        # angles must point from the center at those points.
+        assert math.isclose(math.hypot(lx - cx, ly - cy), radius)
+        assert math.isclose(math.hypot(rx - cx, ry - cy), radius)
+        assert math.isclose(cx + radius * math.cos(start_angle), lx, abs_tol=1e-9)
+        assert math.isclose(cy + radius * math.sin(start_angle), ly, abs_tol=1e-9)
+        assert math.isclose(cx + radius * math.cos(end_angle), rx, abs_tol=1e-9)
+        assert math.isclose(cy + radius * math.sin(end_angle), ry, abs_tol=1e-9)
+
+
+def test_get_cloud_arcs_deterministic() -> None:
+    arcs = get_cloud_arcs(200.0, 100.0, "shape:cloud", SizeStyle.M)
+    again = get_cloud_arcs(200.0, 100.0, "shape:cloud", SizeStyle.M)
+    other = get_cloud_arcs(200.0, 100.0, "shape:other", SizeStyle.M)
+
+    assert np.array_equal(arcs, again)
+    assert not np.array_equal(arcs, other)
+
+
+def test_cloud_arcs_kernel_degenerate() -> None:
+    # Coincident bump points make the circumcircle determinant zero; the
+    # kernel marks those arcs with NaN centers so the drawing code falls
+    # back to a straight line between the bump points.
+    bump_points = np.array([(10.0, 10.0), (10.0, 10.0)])
+    arcs = _cloud_arcs_kernel(bump_points, 20.0, 20.0, 1.0, 1.0, 5.0)
+
+    assert np.isnan(arcs[:, 4]).all()
+    assert np.array_equal(arcs[:, 0:2], bump_points)
+
+
+def test_get_perfect_dash_props() -> None:
+    assert get_perfect_dash_props(100, 2, DashStyle.DRAW) == ([], 0)
+    assert get_perfect_dash_props(100, 2, DashStyle.SOLID) == ([], 0)
+
+    dashes, offset = get_perfect_dash_props(100, 2, DashStyle.DASHED)
+    assert dashes == [4, (100 - 12 * 4) / 12]
+    assert offset == 2
+
+    dashes, offset = get_perfect_dash_props(100, 2, DashStyle.DOTTED)
+    assert dashes == [0.02, (100 - 25 * 0.02) / 25]
+    assert offset == 0
+
+
+def test_get_perfect_dash_props_quantized() -> None:
+    # Lengths within a tenth of a pixel share the same dash pattern.
+    assert get_perfect_dash_props(100.0, 2, DashStyle.DASHED) == get_perfect_dash_props(
+        100.04, 2, DashStyle.DASHED
+    )
+
+
+def test_circle_from_three_points() -> None:
+    center, radius = circle_from_three_points((8, 4), (3, 9), (-2, 4))
+    assert center == Position(3, 4)
+    assert math.isclose(radius, 5)
+
+
+def test_get_polygon_draw_vertices_deterministic() -> None:
+    vertices = ((0.0, 0.0), (50.0, 0.0), (50.0, 50.0), (0.0, 50.0))
+
+    points = get_polygon_draw_vertices(vertices, 3.5, "shape:polygon")
+    again = get_polygon_draw_vertices(vertices, 3.5, "shape:polygon")
+    other = get_polygon_draw_vertices(vertices, 3.5, "shape:different")
+
+    # One line of points per edge, plus the first line repeated for closure
+    assert len(points) == 5 * 32
+    assert points == again
+    assert points != other
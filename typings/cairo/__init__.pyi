@@ -4437,7 +4437,7 @@ class RecordingSurface(Surface):
     .. versionadded:: 1.11.0
     """
 
-    def __init__(self, content: Content, rectangle: Rectangle) -> None:
+    def __init__(self, content: Content, rectangle: Optional[Rectangle]) -> None:
         """
         :param content: the content for the new  surface
         :param rectangle: or None to record unbounded operations.